@@ -0,0 +1 @@
+"""Configuration package (settings are read in config.settings)."""
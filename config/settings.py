@@ -3,65 +3,213 @@ Configuration settings for Friday Reports Automation.
 
 All sensitive credentials are loaded from environment variables.
 Copy .env.example to .env and fill in your values.
+
+The environment (and .env) is read exactly once into an immutable
+Settings instance, SETTINGS. The module-level constants below are
+aliases of its fields, so `from config.settings import DATA_DIR` keeps
+working everywhere.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from dotenv import load_dotenv
+
 # Base Paths
 BASE_DIR = Path(__file__).resolve().parent.parent
-DATA_DIR = BASE_DIR / "data"
-REPORTS_DIR = BASE_DIR / "reports"
-GRAPHS_DIR = REPORTS_DIR / "graphs"
-TEMPLATES_DIR = BASE_DIR / "templates"
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-REPORTS_DIR.mkdir(exist_ok=True)
-GRAPHS_DIR.mkdir(exist_ok=True)
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the pipeline configuration."""
+
+    # Base Paths
+    base_dir: Path
+    data_dir: Path
+    reports_dir: Path
+    graphs_dir: Path
+    templates_dir: Path
+
+    # Google Search Console API
+    gsc_credentials_file: str
+    gsc_token_file: str
+    gsc_scopes: tuple
+
+    # Google Analytics 4 API
+    ga4_credentials_file: str
+    ga4_token_file: str
+    ga4_scopes: tuple
+
+    # Gmail API (for sending reports)
+    gmail_credentials_file: str
+    gmail_token_file: str
+    gmail_scopes: tuple
+
+    # OpenAI API (for GPT-powered analysis)
+    openai_api_key: str
+    openai_model: str
+    openai_draft_model: str  # First-pass model; escalates to openai_model
+
+    # SFTP Configuration (for hosting report graphs)
+    sftp_host: str
+    sftp_port: int
+    sftp_user: str
+    sftp_pass: str
+    sftp_remote_folder: str
+
+    # Image Hosting URL (where uploaded graphs can be accessed)
+    image_host_url: str
+
+    # Email Configuration
+    sender_email: str
+    status_recipient: str  # Email to receive status notifications
+
+    # Client Configuration
+    client_config_file: str
+    client_config_csv: str  # Fast-load copy of client_config_file
+    email_recipients_file: str
+
+    # Intermediate data format between pipeline stages ('parquet' or 'csv')
+    data_format: str = 'parquet'
+
+    # Report Settings
+    report_lookback_days: int = 30
+    comparison_lookback_days: int = 30
+    yoy_comparison: bool = True
+
+    # GPT Analysis Settings
+    analysis_max_chars: int = 480
+    analysis_min_chars: int = 400
+
+    # Largest HTML document (in characters) handed to premailer for CSS inlining
+    inline_css_max_chars: int = 256 * 1024
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env and read the environment once, returning the shared Settings."""
+    load_dotenv(BASE_DIR / ".env")
+
+    reports_dir = BASE_DIR / "reports"
+
+    return Settings(
+        base_dir=BASE_DIR,
+        data_dir=BASE_DIR / "data",
+        reports_dir=reports_dir,
+        graphs_dir=reports_dir / "graphs",
+        templates_dir=BASE_DIR / "templates",
+
+        gsc_credentials_file=os.getenv("GSC_CREDENTIALS_FILE", "credentials/gsc_credentials.json"),
+        gsc_token_file=os.getenv("GSC_TOKEN_FILE", "credentials/gsc_token.json"),
+        gsc_scopes=('https://www.googleapis.com/auth/webmasters.readonly',),
+
+        ga4_credentials_file=os.getenv("GA4_CREDENTIALS_FILE", "credentials/ga4_credentials.json"),
+        ga4_token_file=os.getenv("GA4_TOKEN_FILE", "credentials/ga4_token.json"),
+        ga4_scopes=('https://www.googleapis.com/auth/analytics.readonly',),
+
+        gmail_credentials_file=os.getenv("GMAIL_CREDENTIALS_FILE", "credentials/gmail_credentials.json"),
+        gmail_token_file=os.getenv("GMAIL_TOKEN_FILE", "credentials/gmail_token.json"),
+        gmail_scopes=('https://www.googleapis.com/auth/gmail.compose',),
+
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+        openai_draft_model=os.getenv("OPENAI_DRAFT_MODEL", "gpt-4o-mini"),
+
+        sftp_host=os.getenv("SFTP_HOST"),
+        sftp_port=int(os.getenv("SFTP_PORT", "22")),
+        sftp_user=os.getenv("SFTP_USER"),
+        sftp_pass=os.getenv("SFTP_PASS"),
+        sftp_remote_folder=os.getenv("SFTP_REMOTE_FOLDER", "/public_html/reports/graphs"),
+
+        image_host_url=os.getenv("IMAGE_HOST_URL", "https://your-domain.com/reports/graphs/"),
+
+        sender_email=os.getenv("SENDER_EMAIL"),
+        status_recipient=os.getenv("STATUS_RECIPIENT"),
+
+        client_config_file=os.getenv("CLIENT_CONFIG_FILE", "config/clients.xlsx"),
+        client_config_csv=os.getenv("CLIENT_CONFIG_CSV", "config/clients.csv"),
+        email_recipients_file=os.getenv("EMAIL_RECIPIENTS_FILE", "config/recipients.csv"),
+
+        data_format=os.getenv("DATA_FORMAT", "parquet").lower(),
+
+        inline_css_max_chars=int(os.getenv("INLINE_CSS_MAX_CHARS", str(256 * 1024))),
+    )
+
+
+SETTINGS = get_settings()
+
+# Base Paths
+DATA_DIR = SETTINGS.data_dir
+REPORTS_DIR = SETTINGS.reports_dir
+GRAPHS_DIR = SETTINGS.graphs_dir
+TEMPLATES_DIR = SETTINGS.templates_dir
+
+# Set once the output directories have been created in this process
+_DIRS_READY = False
+
+
+def ensure_dirs():
+    """Create the data/report/graph directories (once per process)."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in (DATA_DIR, REPORTS_DIR, GRAPHS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
+
 
 # Google Search Console API
-GSC_CREDENTIALS_FILE = os.getenv("GSC_CREDENTIALS_FILE", "credentials/gsc_credentials.json")
-GSC_TOKEN_FILE = os.getenv("GSC_TOKEN_FILE", "credentials/gsc_token.pickle")
-GSC_SCOPES = ['https://www.googleapis.com/auth/webmasters.readonly']
+GSC_CREDENTIALS_FILE = SETTINGS.gsc_credentials_file
+GSC_TOKEN_FILE = SETTINGS.gsc_token_file
+GSC_SCOPES = SETTINGS.gsc_scopes
 
 # Google Analytics 4 API
-GA4_CREDENTIALS_FILE = os.getenv("GA4_CREDENTIALS_FILE", "credentials/ga4_credentials.json")
-GA4_TOKEN_FILE = os.getenv("GA4_TOKEN_FILE", "credentials/ga4_token.pickle")
-GA4_SCOPES = ['https://www.googleapis.com/auth/analytics.readonly']
+GA4_CREDENTIALS_FILE = SETTINGS.ga4_credentials_file
+GA4_TOKEN_FILE = SETTINGS.ga4_token_file
+GA4_SCOPES = SETTINGS.ga4_scopes
 
 # Gmail API (for sending reports)
-GMAIL_CREDENTIALS_FILE = os.getenv("GMAIL_CREDENTIALS_FILE", "credentials/gmail_credentials.json")
-GMAIL_TOKEN_FILE = os.getenv("GMAIL_TOKEN_FILE", "credentials/gmail_token.pickle")
-GMAIL_SCOPES = ['https://www.googleapis.com/auth/gmail.compose']
+GMAIL_CREDENTIALS_FILE = SETTINGS.gmail_credentials_file
+GMAIL_TOKEN_FILE = SETTINGS.gmail_token_file
+GMAIL_SCOPES = SETTINGS.gmail_scopes
 
 # OpenAI API (for GPT-powered analysis)
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+OPENAI_API_KEY = SETTINGS.openai_api_key
+OPENAI_MODEL = SETTINGS.openai_model
+OPENAI_DRAFT_MODEL = SETTINGS.openai_draft_model
 
 # SFTP Configuration (for hosting report graphs)
-SFTP_HOST = os.getenv("SFTP_HOST")
-SFTP_PORT = int(os.getenv("SFTP_PORT", "22"))
-SFTP_USER = os.getenv("SFTP_USER")
-SFTP_PASS = os.getenv("SFTP_PASS")
-SFTP_REMOTE_FOLDER = os.getenv("SFTP_REMOTE_FOLDER", "/public_html/reports/graphs")
+SFTP_HOST = SETTINGS.sftp_host
+SFTP_PORT = SETTINGS.sftp_port
+SFTP_USER = SETTINGS.sftp_user
+SFTP_PASS = SETTINGS.sftp_pass
+SFTP_REMOTE_FOLDER = SETTINGS.sftp_remote_folder
 
 # Image Hosting URL (where uploaded graphs can be accessed)
-IMAGE_HOST_URL = os.getenv("IMAGE_HOST_URL", "https://your-domain.com/reports/graphs/")
+IMAGE_HOST_URL = SETTINGS.image_host_url
 
 # Email Configuration
-SENDER_EMAIL = os.getenv("SENDER_EMAIL")
-STATUS_RECIPIENT = os.getenv("STATUS_RECIPIENT")  # Email to receive status notifications
+SENDER_EMAIL = SETTINGS.sender_email
+STATUS_RECIPIENT = SETTINGS.status_recipient
 
 # Client Configuration
-CLIENT_CONFIG_FILE = os.getenv("CLIENT_CONFIG_FILE", "config/clients.xlsx")
-EMAIL_RECIPIENTS_FILE = os.getenv("EMAIL_RECIPIENTS_FILE", "config/recipients.csv")
+CLIENT_CONFIG_FILE = SETTINGS.client_config_file
+CLIENT_CONFIG_CSV = SETTINGS.client_config_csv
+EMAIL_RECIPIENTS_FILE = SETTINGS.email_recipients_file
+
+# Intermediate data format between pipeline stages ('parquet' or 'csv')
+DATA_FORMAT = SETTINGS.data_format
 
 # Report Settings
-REPORT_LOOKBACK_DAYS = 30
-COMPARISON_LOOKBACK_DAYS = 30
-YOY_COMPARISON = True
+REPORT_LOOKBACK_DAYS = SETTINGS.report_lookback_days
+COMPARISON_LOOKBACK_DAYS = SETTINGS.comparison_lookback_days
+YOY_COMPARISON = SETTINGS.yoy_comparison
 
 # GPT Analysis Settings
-ANALYSIS_MAX_CHARS = 480
-ANALYSIS_MIN_CHARS = 400
+ANALYSIS_MAX_CHARS = SETTINGS.analysis_max_chars
+ANALYSIS_MIN_CHARS = SETTINGS.analysis_min_chars
+
+# Largest HTML document (in characters) handed to premailer for CSS inlining
+INLINE_CSS_MAX_CHARS = SETTINGS.inline_css_max_chars
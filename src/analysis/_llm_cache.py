@@ -0,0 +1,54 @@
+"""
+LLM Response Cache
+
+Filesystem cache for GPT-generated text, keyed on a hash of the
+canonicalized request (model, summary type, client and metrics).
+Reruns on unchanged metrics return the stored text instead of paying
+for another API call. Entries expire after CACHE_TTL_SECONDS.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import DATA_DIR
+
+# Cache lives in a subdirectory so cleanup (which only moves top-level files) keeps it
+CACHE_DIR = DATA_DIR / '.llm_cache'
+
+# Entries older than this are ignored and regenerated
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def make_key(**payload) -> str:
+    """Return a stable SHA-256 key for the given request payload."""
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def get(key: str):
+    """Return cached text for key, or None if missing or expired."""
+    cache_file = CACHE_DIR / f'{key}.txt'
+
+    try:
+        if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return cache_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+
+def put(key: str, text: str):
+    """Store text under key (atomic replace, safe across worker threads)."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    cache_file = CACHE_DIR / f'{key}.txt'
+    tmp_file = CACHE_DIR / f'{key}.{os.getpid()}-{threading.get_ident()}.tmp'
+    tmp_file.write_text(text, encoding='utf-8')
+    os.replace(tmp_file, cache_file)
@@ -10,10 +10,14 @@ Summaries are written in professional tone suitable for client reports.
 """
 
 import os
-import json
-import pandas as pd
+import csv
+import gzip
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from openai import OpenAI
+from openai import OpenAI, Timeout
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -21,17 +25,281 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.settings import (
     OPENAI_API_KEY,
     OPENAI_MODEL,
+    OPENAI_DRAFT_MODEL,
     DATA_DIR,
     ANALYSIS_MAX_CHARS,
-    ANALYSIS_MIN_CHARS
+    ANALYSIS_MIN_CHARS,
+    ensure_dirs
 )
+from src.analysis import _llm_cache
+from src.file_scan import list_files
+
+# Static prompt prefixes. Everything that is identical across clients lives in
+# the system message so OpenAI's automatic prompt caching can reuse it; only
+# the client name and metrics go in the (trailing) user message. Caching only
+# applies to prefixes of 1024+ tokens: the shared style guide, rubric and
+# examples keep each system prompt (about 1,400 tokens) above that.
+SUMMARY_STYLE_GUIDE = """Style guide:
+- Describe the size of a change in words rather than figures: "held steady" \
+(under 5%), "edged up/down" (5-10%), "grew/declined noticeably" (10-20%), \
+"increased/decreased significantly" (over 20%).
+- Clicks and impressions measure visibility and traffic; higher is better.
+- CTR is the share of impressions that became clicks; higher is better.
+- Average position is the mean ranking in search results; a LOWER number is \
+better, so a falling position is an improvement.
+- When clicks and impressions move in opposite directions, mention CTR as the \
+likely explanation.
+- Write in plain English for a business reader; avoid jargon and acronyms \
+other than SEO and CTR.
+- Write a single paragraph with no headings, bullet points, greetings or \
+sign-offs, and do not repeat the client name more than once."""
+
+SUMMARY_RUBRIC = """How to decide what to say:
+- Start with the metric that moved the most in relative terms, unless clicks \
+changed by more than a few percent, in which case lead with clicks because \
+they are what clients care about most.
+- If every metric held steady, say so plainly and frame stability as a solid \
+base rather than inventing a story.
+- If clicks rose while impressions fell, the site is converting fewer but \
+better-matched appearances into visits; describe this as improved relevance \
+or a stronger click-through rate.
+- If impressions rose while clicks fell, the site is appearing more often \
+but earning a smaller share of the clicks; point to titles, descriptions or \
+ranking depth as the usual explanation, without claiming certainty.
+- If average position improved (the number went down) but clicks did not \
+follow, note that ranking gains often take time to translate into traffic.
+- If average position worsened (the number went up) while clicks held up, \
+describe the traffic as resilient despite softer rankings.
+- When a metric has no previous data, call it newly tracked rather than \
+describing it as growth.
+- Never speculate about causes that are not supported by the metrics, such \
+as algorithm updates, competitors or site changes, and never promise results.
+- Never mention the data source, the tool that produced the report, or the \
+fact that the summary was written automatically.
+- Prefer active, concrete verbs ("grew", "slipped", "held steady") over \
+vague phrases ("saw movement", "experienced changes").
+- Use British or American spelling consistently within the paragraph.
+- For year-over-year comparisons, treat changes under five percent as \
+essentially flat, and only raise seasonality when the direction of change \
+could plausibly be explained by the time of year.
+- Do not compare this client with other clients, industry averages or \
+earlier reports; describe only the two periods you are given.
+- The forward-looking close should be one short sentence about what to \
+watch or build on next; it must not sound like a sales pitch."""
+
+SUMMARY_EXAMPLES = """Examples of the expected register (the figures behind \
+them are not shown; match the tone and length, not the wording):
+
+Example (clicks and impressions up, position better):
+"Search visibility strengthened across the board this period. Impressions \
+increased significantly and clicks grew noticeably alongside them, showing \
+that the site is reaching more people and turning that reach into visits. \
+Average position also improved, which suggests rankings are moving in the \
+right direction for core terms. Maintaining the current content cadence \
+should help consolidate these gains over the coming weeks."
+
+Example (impressions up, clicks down):
+"The site appeared in search results more often this period, with \
+impressions rising noticeably, but clicks edged down as a smaller share of \
+searchers chose to visit. This points to a lower click-through rate, which \
+often reflects titles and descriptions that could be more compelling for the \
+new queries being reached. Rankings held steady overall. Refining page titles \
+for the most-viewed pages is a sensible next step to watch."
+
+Example (everything stable):
+"Organic search performance held steady this period, with clicks, \
+impressions and click-through rate all close to their previous levels and \
+average position essentially unchanged. This consistency indicates a stable \
+foundation in search, with no sign of lost ground on important terms. With \
+the baseline secure, the coming weeks are a good opportunity to target new \
+topics and build visibility beyond the queries the site already ranks for."
+
+Example (clicks down, position worse):
+"Search performance softened this period. Clicks declined noticeably and \
+impressions edged down, while average position slipped, meaning the site is \
+appearing slightly lower in results for its established queries. The \
+click-through rate held up, so searchers who do see the site still engage \
+with it. Reviewing the pages that lost ranking and refreshing their content \
+will be the priority for recovering visibility in the weeks ahead."
+
+Example (year over year, strong growth):
+"Compared with the same period last year, organic search has grown \
+substantially. Clicks and impressions both increased significantly, and \
+average position improved, indicating that the site now ranks for a broader \
+and more valuable set of queries than it did a year ago. This is a clear sign \
+that the long-term search strategy is paying off, and the focus now should be \
+on protecting these rankings while extending into related topics."
+
+Example (year over year, mixed with a seasonal note):
+"Year over year, impressions held steady while clicks declined noticeably, \
+suggesting the site is as visible as it was last year but is earning a \
+smaller share of visits from that visibility. Part of this may reflect \
+seasonal demand, as this period last year was typically busier for the \
+sector. Average position is broadly unchanged. Improving how key pages are \
+presented in results should help recover click share as demand returns."
+
+Example (year over year, newly tracked metric):
+"Against the same period last year, clicks grew noticeably and average \
+position improved, showing steady long-term progress in search. Impressions \
+are newly tracked for this site, so there is no prior-year figure to compare \
+them with yet; they will provide a useful benchmark from next year onwards. \
+Overall, the trend points to a healthier search presence than a year ago, \
+and sustaining the current approach should keep that momentum going."
+"""
+
+SYSTEM_PROMPT_30V30 = f"""You are a professional SEO analyst who writes clear, concise performance summaries for client reports.
+
+You will be given a client name and their search performance for the last \
+30 days compared with the previous 30 days.
+
+Write a professional summary paragraph (between {ANALYSIS_MIN_CHARS} and {ANALYSIS_MAX_CHARS} characters) that:
+1. Highlights the most significant changes
+2. Provides context for the performance
+3. Maintains a professional, informative tone
+4. Does NOT include specific numbers (use terms like "increased significantly", "slight decline", etc.)
+5. Ends with a brief forward-looking statement
+
+Important: Keep the summary concise and focused on the key takeaways.
+
+{SUMMARY_STYLE_GUIDE}
+
+{SUMMARY_RUBRIC}
+
+{SUMMARY_EXAMPLES}"""
+
+SYSTEM_PROMPT_YOY = f"""You are a professional SEO analyst specializing in long-term performance trends.
+
+You will be given a client name and their search performance for the last \
+30 days compared with the same 30-day period last year.
+
+Write a professional summary paragraph (between {ANALYSIS_MIN_CHARS} and {ANALYSIS_MAX_CHARS} characters) that:
+1. Contextualizes the year-over-year changes
+2. Acknowledges any seasonal factors that might apply
+3. Highlights long-term trends
+4. Does NOT include specific numbers
+5. Maintains an objective, analytical tone
+
+Important: Focus on the strategic implications of the year-over-year performance.
+
+{SUMMARY_STYLE_GUIDE}
+
+{SUMMARY_RUBRIC}
+
+{SUMMARY_EXAMPLES}"""
+
+# Metrics files are gzipped; plain .csv from older runs still match
+METRICS_SUFFIXES = ('.csv', '.csv.gz')
+
+# Maximum number of concurrent OpenAI requests
+MAX_WORKERS = 8
 
+# Candidate summaries requested per API call (prompt is billed once)
+SUMMARY_CANDIDATES = 2
+
+# Retries for rate-limited (429) and transient 5xx responses; the OpenAI SDK
+# applies exponential backoff between attempts
+OPENAI_MAX_RETRIES = 5
+
+# Per-request timeout; fail fast on connect, allow time for generation
+OPENAI_TIMEOUT = Timeout(60.0, connect=5.0)
+
+# Running totals for prompt cache reporting
+PROMPT_CACHE_STATS = {'prompt_tokens': 0, 'cached_tokens': 0}
+_STATS_LOCK = threading.Lock()
+
+
+def record_prompt_usage(response):
+    """Accumulate prompt and cached-prompt token counts from a response."""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return
+
+    details = getattr(usage, 'prompt_tokens_details', None)
+    cached = getattr(details, 'cached_tokens', 0) or 0
+
+    with _STATS_LOCK:
+        PROMPT_CACHE_STATS['prompt_tokens'] += usage.prompt_tokens
+        PROMPT_CACHE_STATS['cached_tokens'] += cached
+
+
+def summary_in_range(summary: str) -> bool:
+    """Return True if the summary length is within the accepted range."""
+    return ANALYSIS_MIN_CHARS <= len(summary) <= ANALYSIS_MAX_CHARS + 50
+
+
+def select_summary(candidates: list) -> str:
+    """
+    Pick the best of several candidate summaries.
+
+    Returns the first candidate whose length is within
+    [ANALYSIS_MIN_CHARS, ANALYSIS_MAX_CHARS + 50]. If none qualifies, the
+    longest is used and cut back to its last full sentence when oversized.
+    """
+    for summary in candidates:
+        if summary_in_range(summary):
+            return summary
+
+    summary = max(candidates, key=len)
+
+    if len(summary) > ANALYSIS_MAX_CHARS + 50:
+        # Truncate at last sentence
+        summary = summary[:ANALYSIS_MAX_CHARS]
+        last_period = summary.rfind('.')
+        if last_period > ANALYSIS_MIN_CHARS:
+            summary = summary[:last_period + 1]
+
+    return summary
+
+
+def request_summary(system_prompt: str, user_prompt: str) -> str:
+    """
+    Request a summary, drafting with OPENAI_DRAFT_MODEL first.
+
+    Escalates once to OPENAI_MODEL only when none of the draft candidates
+    lands within the target length.
+    """
+    client = get_openai_client()
+    summary = ''
+
+    # dict.fromkeys keeps order and drops the escalation if both models match
+    for model in dict.fromkeys((OPENAI_DRAFT_MODEL, OPENAI_MODEL)):
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.7,
+            max_tokens=350,
+            n=SUMMARY_CANDIDATES
+        )
+        record_prompt_usage(response)
 
+        summary = select_summary([
+            choice.message.content.strip() for choice in response.choices
+        ])
+        if summary_in_range(summary):
+            break
+        print(f"⚠️ {model} summary out of range ({len(summary)} chars)")
+
+    return summary
+
+
+@lru_cache(maxsize=1)
 def get_openai_client():
-    """Initialize OpenAI client."""
+    """
+    Initialize the OpenAI client once per process.
+
+    The client is thread-safe, so every worker shares its connection pool
+    instead of paying a new TLS handshake per summary.
+    """
     if not OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY environment variable not set")
-    return OpenAI(api_key=OPENAI_API_KEY)
+    return OpenAI(
+        api_key=OPENAI_API_KEY,
+        timeout=OPENAI_TIMEOUT,
+        max_retries=OPENAI_MAX_RETRIES
+    )
 
 
 def generate_30v30_summary(metrics_data: dict, client_name: str) -> str:
@@ -45,59 +313,36 @@ def generate_30v30_summary(metrics_data: dict, client_name: str) -> str:
     Returns:
         Professional summary paragraph (400-480 characters)
     """
-    client = get_openai_client()
-
     # Format metrics for the prompt
-    metrics_text = ""
-    for metric, data in metrics_data.items():
-        metrics_text += f"- {metric.title()}: {data['current']:,.0f} "
-        metrics_text += f"(was {data['previous']:,.0f}, change: {data['change_pct']:+.1f}%)\n"
+    metrics_text = "\n".join(
+        f"- {metric.title()}: {data['current']:,.0f} "
+        f"(was {data['previous']:,.0f}, change: {data['change_pct']:+.1f}%)"
+        for metric, data in metrics_data.items()
+    )
 
-    prompt = f"""You are an SEO analyst writing a brief performance summary for a client report.
-
-Client: {client_name}
+    user_prompt = f"""Client: {client_name}
 
 30-Day Performance vs Previous 30 Days:
-{metrics_text}
-
-Write a professional summary paragraph (between {ANALYSIS_MIN_CHARS} and {ANALYSIS_MAX_CHARS} characters) that:
-1. Highlights the most significant changes
-2. Provides context for the performance
-3. Maintains a professional, informative tone
-4. Does NOT include specific numbers (use terms like "increased significantly", "slight decline", etc.)
-5. Ends with a brief forward-looking statement
-
-Important: Keep the summary concise and focused on the key takeaways."""
+{metrics_text}"""
+
+    cache_key = _llm_cache.make_key(
+        model=OPENAI_MODEL, draft_model=OPENAI_DRAFT_MODEL, fn='30v30',
+        client=client_name, metrics=metrics_data,
+        # The full prompts, so editing either one invalidates old summaries
+        system_prompt=SYSTEM_PROMPT_30V30, user_prompt=user_prompt
+    )
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": "You are a professional SEO analyst who writes clear, concise performance summaries."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=300
-        )
-
-        summary = response.choices[0].message.content.strip()
-
-        # Validate length
-        if len(summary) < ANALYSIS_MIN_CHARS:
-            print(f"⚠️ Summary too short ({len(summary)} chars), regenerating...")
-            return generate_30v30_summary(metrics_data, client_name)
-        elif len(summary) > ANALYSIS_MAX_CHARS + 50:
-            # Truncate at last sentence
-            summary = summary[:ANALYSIS_MAX_CHARS]
-            last_period = summary.rfind('.')
-            if last_period > ANALYSIS_MIN_CHARS:
-                summary = summary[:last_period + 1]
-
+        summary = request_summary(SYSTEM_PROMPT_30V30, user_prompt)
+        _llm_cache.put(cache_key, summary)
         return summary
 
     except Exception as e:
         print(f"❌ Error generating summary: {e}")
-        return f"Performance data for the past 30 days shows varied results across key metrics. Please review the detailed data for specific insights."
+        return "Performance data for the past 30 days shows varied results across key metrics. Please review the detailed data for specific insights."
 
 
 def generate_yoy_summary(metrics_data: dict, client_name: str) -> str:
@@ -111,49 +356,30 @@ def generate_yoy_summary(metrics_data: dict, client_name: str) -> str:
     Returns:
         Professional summary paragraph
     """
-    client = get_openai_client()
+    metrics_text = "\n".join(
+        f"- {metric.title()}: {data['current_year']:,.0f} "
+        f"(last year: {data['previous_year']:,.0f}, change: {data['change_pct']:+.1f}%)"
+        for metric, data in metrics_data.items()
+    )
 
-    metrics_text = ""
-    for metric, data in metrics_data.items():
-        metrics_text += f"- {metric.title()}: {data['current_year']:,.0f} "
-        metrics_text += f"(last year: {data['previous_year']:,.0f}, change: {data['change_pct']:+.1f}%)\n"
-
-    prompt = f"""You are an SEO analyst writing a year-over-year performance summary.
-
-Client: {client_name}
+    user_prompt = f"""Client: {client_name}
 
 Year-over-Year Comparison (same 30-day period):
-{metrics_text}
-
-Write a professional summary paragraph (between {ANALYSIS_MIN_CHARS} and {ANALYSIS_MAX_CHARS} characters) that:
-1. Contextualizes the year-over-year changes
-2. Acknowledges any seasonal factors that might apply
-3. Highlights long-term trends
-4. Does NOT include specific numbers
-5. Maintains an objective, analytical tone
-
-Important: Focus on the strategic implications of the year-over-year performance."""
+{metrics_text}"""
+
+    cache_key = _llm_cache.make_key(
+        model=OPENAI_MODEL, draft_model=OPENAI_DRAFT_MODEL, fn='yoy',
+        client=client_name, metrics=metrics_data,
+        # The full prompts, so editing either one invalidates old summaries
+        system_prompt=SYSTEM_PROMPT_YOY, user_prompt=user_prompt
+    )
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": "You are a professional SEO analyst specializing in long-term performance trends."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=300
-        )
-
-        summary = response.choices[0].message.content.strip()
-
-        # Validate and adjust length
-        if len(summary) > ANALYSIS_MAX_CHARS + 50:
-            summary = summary[:ANALYSIS_MAX_CHARS]
-            last_period = summary.rfind('.')
-            if last_period > ANALYSIS_MIN_CHARS:
-                summary = summary[:last_period + 1]
-
+        summary = request_summary(SYSTEM_PROMPT_YOY, user_prompt)
+        _llm_cache.put(cache_key, summary)
         return summary
 
     except Exception as e:
@@ -161,24 +387,45 @@ Important: Focus on the strategic implications of the year-over-year performance
         return "Year-over-year performance shows continued organic search development. Detailed analysis of seasonal patterns and long-term trends is available in the full report."
 
 
+def generate_and_save(generator, metrics: dict, client_name: str, summary_file: Path) -> str:
+    """Generate a summary and write it to summary_file (runs in a worker thread)."""
+    summary = generator(metrics, client_name)
+    summary_file.write_text(summary)
+    return summary
+
+
+def metrics_file_slug(file_path: Path, prefix: str) -> str:
+    """Return the client slug from a (possibly gzipped) metrics file name."""
+    name = file_path.name
+    for suffix in ('.gz', '.csv'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return name.replace(prefix, '', 1)
+
+
 def load_metrics_file(file_path: Path) -> dict:
-    """Load metrics from CSV file into dictionary format."""
+    """Load metrics from a CSV (or gzipped CSV) file into dictionary format."""
     try:
-        df = pd.read_csv(file_path)
         metrics = {}
+        opener = gzip.open if file_path.suffix == '.gz' else open
 
-        for _, row in df.iterrows():
-            metric_name = row['metric']
-            metrics[metric_name] = {
-                'current': row.get('current', row.get('current_year', 0)),
-                'previous': row.get('previous', row.get('previous_year', 0)),
-                'change_pct': row.get('change_pct', 0)
-            }
-            # Handle YoY specific columns
-            if 'current_year' in row:
-                metrics[metric_name]['current_year'] = row['current_year']
-            if 'previous_year' in row:
-                metrics[metric_name]['previous_year'] = row['previous_year']
+        with opener(file_path, 'rt', newline='') as f:
+            for row in csv.DictReader(f):
+                current = float(row.get('current') or row.get('current_year') or 0)
+                previous = float(row.get('previous') or row.get('previous_year') or 0)
+
+                metric = {
+                    'current': current,
+                    'previous': previous,
+                    'change_pct': float(row.get('change_pct') or 0)
+                }
+                # Handle YoY specific columns
+                if 'current_year' in row:
+                    metric['current_year'] = current
+                if 'previous_year' in row:
+                    metric['previous_year'] = previous
+
+                metrics[row['metric']] = metric
 
         return metrics
 
@@ -193,6 +440,8 @@ def run():
 
     Generates GPT-powered summaries for all client data.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("🤖 GPT Summary Writer")
     print("=" * 60)
@@ -204,36 +453,30 @@ def run():
         }
 
     # Find growth metrics files
-    growth_files = list(DATA_DIR.glob('growth-metrics-*.csv'))
-    yoy_files = list(DATA_DIR.glob('yoy-metrics-*.csv'))
+    growth_files = list_files(DATA_DIR, 'growth-metrics-', METRICS_SUFFIXES)
+    yoy_files = list_files(DATA_DIR, 'yoy-metrics-', METRICS_SUFFIXES)
 
     print(f"📁 Found {len(growth_files)} growth metric files")
     print(f"📁 Found {len(yoy_files)} YoY metric files")
 
-    summaries = {}
+    # Queue one job per summary: (key, output file, generator, metrics, client name)
+    jobs = []
 
-    # Generate 30v30 summaries
     for file_path in growth_files:
-        client_slug = file_path.stem.replace('growth-metrics-', '')
+        client_slug = metrics_file_slug(file_path, 'growth-metrics-')
         client_name = client_slug.replace('-', ' ').title()
-        print(f"\n✍️ Generating 30v30 summary: {client_name}")
 
         metrics = load_metrics_file(file_path)
         if metrics:
-            summary = generate_30v30_summary(metrics, client_name)
-            summaries[f'{client_slug}_30v30'] = summary
-            print(f"   ✅ Summary generated ({len(summary)} chars)")
-
-            # Save individual summary
-            summary_file = DATA_DIR / f'summary-30v30-{client_slug}.txt'
-            with open(summary_file, 'w') as f:
-                f.write(summary)
+            jobs.append((
+                f'{client_slug}_30v30',
+                DATA_DIR / f'summary-30v30-{client_slug}.txt',
+                generate_30v30_summary, metrics, client_name
+            ))
 
-    # Generate YoY summaries
     for file_path in yoy_files:
-        client_slug = file_path.stem.replace('yoy-metrics-', '')
+        client_slug = metrics_file_slug(file_path, 'yoy-metrics-')
         client_name = client_slug.replace('-', ' ').title()
-        print(f"\n✍️ Generating YoY summary: {client_name}")
 
         metrics = load_metrics_file(file_path)
         if metrics:
@@ -246,21 +489,45 @@ def run():
                     'change_pct': data.get('change_pct', 0)
                 }
 
-            summary = generate_yoy_summary(yoy_metrics, client_name)
-            summaries[f'{client_slug}_yoy'] = summary
-            print(f"   ✅ Summary generated ({len(summary)} chars)")
+            jobs.append((
+                f'{client_slug}_yoy',
+                DATA_DIR / f'summary-yoy-{client_slug}.txt',
+                generate_yoy_summary, yoy_metrics, client_name
+            ))
+
+    # API calls are I/O-bound, so fan them out; each worker saves its own file
+    print(f"\n✍️ Generating {len(jobs)} summaries...")
+    generated = {}
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as executor:
+            futures = {
+                executor.submit(generate_and_save, generator, metrics, client_name, summary_file): key
+                for key, summary_file, generator, metrics, client_name in jobs
+            }
+
+            for future in as_completed(futures):
+                key = futures[future]
+                summary = future.result()
+                generated[key] = summary
+                print(f"   ✅ {key}: summary generated ({len(summary)} chars)")
 
-            # Save individual summary
-            summary_file = DATA_DIR / f'summary-yoy-{client_slug}.txt'
-            with open(summary_file, 'w') as f:
-                f.write(summary)
+    # Keep a stable key order in the combined output
+    summaries = {key: generated[key] for key, *_ in jobs}
 
     # Save all summaries to JSON
-    with open(DATA_DIR / 'all-summaries.json', 'w') as f:
-        json.dump(summaries, f, indent=2)
+    (DATA_DIR / 'all-summaries.json').write_bytes(
+        orjson.dumps(summaries, option=orjson.OPT_INDENT_2)
+    )
 
     print(f"\n✅ Generated {len(summaries)} summaries")
 
+    prompt_tokens = PROMPT_CACHE_STATS['prompt_tokens']
+    if prompt_tokens:
+        cached_tokens = PROMPT_CACHE_STATS['cached_tokens']
+        print(f"   Prompt cache: {cached_tokens:,}/{prompt_tokens:,} prompt tokens cached "
+              f"({cached_tokens / prompt_tokens:.0%})")
+
     return {
         'success': True,
         'message': f'Generated {len(summaries)} summaries',
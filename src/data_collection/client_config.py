@@ -0,0 +1,88 @@
+"""
+Client Configuration Loader
+
+Loads the client list (name, GSC property, GA4 property ID) used by the
+data collection modules.
+
+The Excel workbook (CLIENT_CONFIG_FILE) is the editable source of truth.
+Parsing it pulls in openpyxl and is slow, so a CSV copy (CLIENT_CONFIG_CSV)
+is written alongside it and used whenever it is at least as new as the
+workbook. Results are memoized for the lifetime of the process.
+"""
+
+import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import CLIENT_CONFIG_FILE, CLIENT_CONFIG_CSV
+
+
+def _csv_copy_is_current(config_path: Path, csv_path: Path) -> bool:
+    """Return True if the CSV copy exists and is not older than the workbook."""
+    if not csv_path.exists():
+        return False
+    if not config_path.exists():
+        return True
+    return csv_path.stat().st_mtime >= config_path.stat().st_mtime
+
+
+def convert_client_config_to_csv() -> Path:
+    """
+    Write the Excel client config out as CLIENT_CONFIG_CSV.
+
+    Returns:
+        Path to the CSV copy
+    """
+    config_path = Path(CLIENT_CONFIG_FILE)
+    csv_path = Path(CLIENT_CONFIG_CSV)
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Client config not found: {config_path}")
+
+    df = pd.read_excel(config_path, engine='openpyxl')
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(csv_path, index=False)
+
+    load_client_config.cache_clear()
+    return csv_path
+
+
+@lru_cache(maxsize=1)
+def load_client_config() -> pd.DataFrame:
+    """
+    Load client configuration with site URLs and GA4 property IDs.
+
+    The returned DataFrame is shared between callers; treat it as read-only.
+    """
+    config_path = Path(CLIENT_CONFIG_FILE)
+    csv_path = Path(CLIENT_CONFIG_CSV)
+
+    if config_path.suffix.lower() == '.csv':
+        if not config_path.exists():
+            raise FileNotFoundError(f"Client config not found: {config_path}")
+        return pd.read_csv(config_path)
+
+    if _csv_copy_is_current(config_path, csv_path):
+        return pd.read_csv(csv_path)
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Client config not found: {config_path}")
+
+    df = pd.read_excel(config_path, engine='openpyxl')
+
+    # Refresh the CSV copy so the next run can skip the workbook
+    try:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(csv_path, index=False)
+    except OSError as e:
+        print(f"⚠️ Could not write client config CSV copy: {e}")
+
+    return df
+
+
+if __name__ == '__main__':
+    output_path = convert_client_config_to_csv()
+    print(f"✅ Client config written to {output_path}")
@@ -14,14 +14,18 @@ Metrics retrieved:
 """
 
 import os
-import pickle
+import json
+import asyncio
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 from pathlib import Path
 
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
 from google.analytics.data_v1beta.types import (
     DateRange, Dimension, Metric, RunReportRequest, FilterExpression,
     Filter, FilterExpressionList
@@ -37,22 +41,43 @@ from config.settings import (
     GA4_SCOPES,
     DATA_DIR,
     REPORT_LOOKBACK_DAYS,
-    CLIENT_CONFIG_FILE
+    ensure_dirs
 )
+from src.data_collection.client_config import load_client_config
+from src.data_processing.storage import GZIP_CSV
 
+# Maximum number of GA4 requests in flight at once
+MAX_CONCURRENT_REQUESTS = 16
 
+# Refresh the OAuth token before fetching if it expires sooner than this
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _save_token(creds):
+    """Persist OAuth credentials to the token cache file (atomic replace)."""
+    token_path = Path(GA4_TOKEN_FILE)
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = token_path.with_name(f'{token_path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+@lru_cache(maxsize=1)
 def get_ga4_credentials():
     """
     Authenticate and return GA4 credentials.
 
-    Uses OAuth2 flow with token caching for subsequent runs.
+    Uses OAuth2 flow with token caching for subsequent runs. The token is
+    stored as authorized-user JSON and memoized so it is only read once
+    per process.
     """
     creds = None
     token_path = Path(GA4_TOKEN_FILE)
 
     if token_path.exists():
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
+        creds = Credentials.from_authorized_user_info(
+            json.loads(token_path.read_text()), GA4_SCOPES
+        )
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -63,29 +88,60 @@ def get_ga4_credentials():
             )
             creds = flow.run_local_server(port=0)
 
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+        _save_token(creds)
 
     return creds
 
 
-def fetch_organic_metrics(property_id: str, start_date: str, end_date: str,
-                          credentials) -> dict:
+def refresh_if_expiring(creds):
+    """
+    Refresh credentials up front if they expire within TOKEN_REFRESH_MARGIN.
+
+    Called once before the fetch loop so concurrent requests never race to
+    refresh the same token mid-run.
+    """
+    if creds.expiry and creds.refresh_token:
+        if creds.expiry - datetime.utcnow() < TOKEN_REFRESH_MARGIN:
+            creds.refresh(Request())
+            _save_token(creds)
+    return creds
+
+
+def _empty_metrics() -> dict:
+    """Return a zeroed metrics dict used when GA4 returns no data."""
+    return {
+        'new_users': 0, 'engaged_sessions': 0, 'engagement_rate': 0,
+        'avg_session_duration': 0, 'sessions': 0, 'bounce_rate': 0
+    }
+
+
+def _parse_metrics_row(row) -> dict:
+    """Convert a GA4 response row into the metrics dict used downstream."""
+    return {
+        'new_users': int(row.metric_values[0].value),
+        'engaged_sessions': int(row.metric_values[1].value),
+        'engagement_rate': float(row.metric_values[2].value),
+        'avg_session_duration': float(row.metric_values[3].value),
+        'sessions': int(row.metric_values[4].value),
+        'bounce_rate': float(row.metric_values[5].value),
+    }
+
+
+async def fetch_organic_metrics_async(property_id: str, date_ranges: list, client) -> list:
     """
-    Fetch organic search metrics for a GA4 property.
+    Fetch organic search metrics for a GA4 property over several date ranges.
+
+    All ranges go into a single RunReportRequest; GA4 returns one row per
+    range, tagged with the range name in the ``dateRange`` dimension.
 
     Args:
         property_id: GA4 property ID (e.g., '123456789')
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        credentials: OAuth2 credentials
+        date_ranges: List of (start_date, end_date) tuples in YYYY-MM-DD format
+        client: Shared BetaAnalyticsDataAsyncClient instance
 
     Returns:
-        dict with organic traffic metrics
+        list of metric dicts, one per date range in the order given
     """
-    client = BetaAnalyticsDataClient(credentials=credentials)
-
     # Filter for organic search traffic
     organic_filter = FilterExpression(
         filter=Filter(
@@ -97,9 +153,14 @@ def fetch_organic_metrics(property_id: str, start_date: str, end_date: str,
         )
     )
 
+    range_names = [f"r{i}" for i in range(len(date_ranges))]
+
     request = RunReportRequest(
         property=f"properties/{property_id}",
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+        date_ranges=[
+            DateRange(start_date=start_date, end_date=end_date, name=name)
+            for name, (start_date, end_date) in zip(range_names, date_ranges)
+        ],
         metrics=[
             Metric(name="newUsers"),
             Metric(name="engagedSessions"),
@@ -112,30 +173,21 @@ def fetch_organic_metrics(property_id: str, start_date: str, end_date: str,
     )
 
     try:
-        response = client.run_report(request)
-
-        if response.rows:
-            row = response.rows[0]
-            return {
-                'new_users': int(row.metric_values[0].value),
-                'engaged_sessions': int(row.metric_values[1].value),
-                'engagement_rate': float(row.metric_values[2].value),
-                'avg_session_duration': float(row.metric_values[3].value),
-                'sessions': int(row.metric_values[4].value),
-                'bounce_rate': float(row.metric_values[5].value),
-            }
-
-        return {
-            'new_users': 0, 'engaged_sessions': 0, 'engagement_rate': 0,
-            'avg_session_duration': 0, 'sessions': 0, 'bounce_rate': 0
-        }
+        response = await client.run_report(request)
+
+        # Ranges without data are omitted, so match rows by range name
+        header_names = [header.name for header in response.dimension_headers]
+        range_index = header_names.index('dateRange') if 'dateRange' in header_names else 0
+
+        by_range = {}
+        for row in response.rows:
+            by_range[row.dimension_values[range_index].value] = _parse_metrics_row(row)
+
+        return [by_range.get(name, _empty_metrics()) for name in range_names]
 
     except Exception as e:
-        print(f"❌ Error fetching GA4 data: {e}")
-        return {
-            'new_users': 0, 'engaged_sessions': 0, 'engagement_rate': 0,
-            'avg_session_duration': 0, 'sessions': 0, 'bounce_rate': 0
-        }
+        print(f"❌ Error fetching GA4 data for property {property_id}: {e}")
+        return [_empty_metrics() for _ in date_ranges]
 
 
 def format_duration(seconds: float) -> str:
@@ -150,10 +202,55 @@ def format_percentage(value: float) -> str:
     return f"{value * 100:.1f}%"
 
 
-def calculate_date_ranges():
-    """Calculate date ranges for comparisons."""
-    today = datetime.today()
+def format_change(current: np.ndarray, previous: np.ndarray) -> list:
+    """Format period-over-period changes, using 'N/A'/'+∞' when previous is zero."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = np.where(previous == 0, np.nan, (current - previous) / previous * 100)
+
+    return [
+        ("N/A" if cur == 0 else "+∞") if prev == 0 else f"{pct:+.1f}%"
+        for cur, prev, pct in zip(current, previous, change)
+    ]
+
 
+# Rows of the GA4 comparison table: (display name, metrics key, value formatter)
+COMPARISON_METRICS = [
+    ('New Users', 'new_users', None),
+    ('Engaged Sessions', 'engaged_sessions', None),
+    ('Engagement Rate', 'engagement_rate', format_percentage),
+    ('Avg Session Duration', 'avg_session_duration', format_duration),
+    ('Bounce Rate', 'bounce_rate', format_percentage),
+]
+
+
+def build_comparison_df(current_metrics: dict, previous_metrics: dict) -> pd.DataFrame:
+    """Build the current vs previous period comparison table column by column."""
+    current_raw = np.array([current_metrics[key] for _, key, _ in COMPARISON_METRICS], dtype=float)
+    previous_raw = np.array([previous_metrics[key] for _, key, _ in COMPARISON_METRICS], dtype=float)
+
+    def display(metrics):
+        return [
+            formatter(metrics[key]) if formatter else metrics[key]
+            for _, key, formatter in COMPARISON_METRICS
+        ]
+
+    return pd.DataFrame({
+        'Metric': [name for name, _, _ in COMPARISON_METRICS],
+        'Current Period': display(current_metrics),
+        'Previous Period': display(previous_metrics),
+        'Change': format_change(current_raw, previous_raw),
+    })
+
+
+class DateRanges(NamedTuple):
+    """Report periods as (start_date, end_date) strings in YYYY-MM-DD format."""
+    current: tuple[str, str]
+    previous: tuple[str, str]
+
+
+@lru_cache(maxsize=1)
+def _compute_date_ranges(today: date) -> DateRanges:
+    """Compute the comparison periods relative to the given day."""
     # Current 30 days (ending yesterday for complete data)
     current_end = today - timedelta(days=1)
     current_start = current_end - timedelta(days=REPORT_LOOKBACK_DAYS - 1)
@@ -162,19 +259,36 @@ def calculate_date_ranges():
     previous_end = current_start - timedelta(days=1)
     previous_start = previous_end - timedelta(days=REPORT_LOOKBACK_DAYS - 1)
 
-    return {
-        'current': (current_start.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')),
-        'previous': (previous_start.strftime('%Y-%m-%d'), previous_end.strftime('%Y-%m-%d')),
-    }
+    return DateRanges(
+        current=(current_start.isoformat(), current_end.isoformat()),
+        previous=(previous_start.isoformat(), previous_end.isoformat()),
+    )
+
+
+def calculate_date_ranges() -> DateRanges:
+    """Calculate date ranges for comparisons (cached per calendar day)."""
+    return _compute_date_ranges(date.today())
+
+
+async def fetch_all_async(property_ids: list, date_ranges: list, credentials) -> list:
+    """
+    Fetch metrics for many GA4 properties over a single async gRPC channel.
+
+    The client is created inside the running event loop (gRPC aio channels
+    are bound to the loop that created them) and requests are multiplexed
+    over it, at most MAX_CONCURRENT_REQUESTS at a time.
 
+    Returns:
+        list of per-range metric lists, in the order of property_ids
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-def load_client_config() -> pd.DataFrame:
-    """Load client configuration with GA4 property IDs."""
-    config_path = Path(CLIENT_CONFIG_FILE)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Client config not found: {config_path}")
+    async with BetaAnalyticsDataAsyncClient(credentials=credentials) as client:
+        async def fetch_one(property_id):
+            async with semaphore:
+                return await fetch_organic_metrics_async(property_id, date_ranges, client)
 
-    return pd.read_excel(config_path)
+        return await asyncio.gather(*(fetch_one(pid) for pid in property_ids))
 
 
 def run():
@@ -183,6 +297,8 @@ def run():
 
     Fetches organic traffic data for all configured clients.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("📊 Google Analytics 4 Data Fetcher")
     print("=" * 60)
@@ -194,18 +310,18 @@ def run():
     except Exception as e:
         return {'success': False, 'message': f"Failed to load client config: {e}"}
 
-    # Get credentials
-    credentials = get_ga4_credentials()
+    # Get credentials (refreshed before any request goes out)
+    credentials = refresh_if_expiring(get_ga4_credentials())
 
     # Calculate date ranges
     date_ranges = calculate_date_ranges()
     print(f"\n📅 Date Ranges:")
-    print(f"   Current: {date_ranges['current'][0]} to {date_ranges['current'][1]}")
-    print(f"   Previous: {date_ranges['previous'][0]} to {date_ranges['previous'][1]}")
-
-    results = []
+    print(f"   Current: {date_ranges.current[0]} to {date_ranges.current[1]}")
+    print(f"   Previous: {date_ranges.previous[0]} to {date_ranges.previous[1]}")
 
-    for _, client in clients_df.iterrows():
+    # Collect clients with a configured GA4 property
+    targets = []
+    for client in clients_df.to_dict(orient='records'):
         client_name = client.get('client_name', 'Unknown')
         property_id = client.get('ga4_property_id', '')
 
@@ -213,71 +329,34 @@ def run():
             print(f"⚠️ Skipping {client_name}: No GA4 property configured")
             continue
 
-        print(f"\n📈 Processing: {client_name}")
-        print(f"   Property ID: {property_id}")
+        targets.append((client_name, str(property_id)))
 
-        # Fetch metrics for current period
-        current_metrics = fetch_organic_metrics(
-            str(property_id),
-            date_ranges['current'][0],
-            date_ranges['current'][1],
-            credentials
-        )
+    # Fetch current + previous periods for every property concurrently.
+    # Clients sharing a property (e.g. sub-brands) reuse a single request.
+    property_ids = list(dict.fromkeys(property_id for _, property_id in targets))
+    property_metrics = asyncio.run(fetch_all_async(
+        property_ids,
+        [date_ranges.current, date_ranges.previous],
+        credentials
+    ))
+    fetched_by_property = dict(zip(property_ids, property_metrics))
+    fetched = [fetched_by_property[property_id] for _, property_id in targets]
 
-        # Fetch metrics for previous period
-        previous_metrics = fetch_organic_metrics(
-            str(property_id),
-            date_ranges['previous'][0],
-            date_ranges['previous'][1],
-            credentials
-        )
+    results = []
+
+    for (client_name, property_id), (current_metrics, previous_metrics) in zip(targets, fetched):
+        print(f"\n📈 Processing: {client_name}")
+        print(f"   Property ID: {property_id}")
 
-        # Calculate changes
-        def calc_change(current, previous):
-            if previous == 0:
-                return "N/A" if current == 0 else "+∞"
-            change = ((current - previous) / previous) * 100
-            return f"{change:+.1f}%"
-
-        # Create comparison DataFrame
-        comparison_df = pd.DataFrame([
-            {
-                'Metric': 'New Users',
-                'Current Period': current_metrics['new_users'],
-                'Previous Period': previous_metrics['new_users'],
-                'Change': calc_change(current_metrics['new_users'], previous_metrics['new_users'])
-            },
-            {
-                'Metric': 'Engaged Sessions',
-                'Current Period': current_metrics['engaged_sessions'],
-                'Previous Period': previous_metrics['engaged_sessions'],
-                'Change': calc_change(current_metrics['engaged_sessions'], previous_metrics['engaged_sessions'])
-            },
-            {
-                'Metric': 'Engagement Rate',
-                'Current Period': format_percentage(current_metrics['engagement_rate']),
-                'Previous Period': format_percentage(previous_metrics['engagement_rate']),
-                'Change': calc_change(current_metrics['engagement_rate'], previous_metrics['engagement_rate'])
-            },
-            {
-                'Metric': 'Avg Session Duration',
-                'Current Period': format_duration(current_metrics['avg_session_duration']),
-                'Previous Period': format_duration(previous_metrics['avg_session_duration']),
-                'Change': calc_change(current_metrics['avg_session_duration'], previous_metrics['avg_session_duration'])
-            },
-            {
-                'Metric': 'Bounce Rate',
-                'Current Period': format_percentage(current_metrics['bounce_rate']),
-                'Previous Period': format_percentage(previous_metrics['bounce_rate']),
-                'Change': calc_change(current_metrics['bounce_rate'], previous_metrics['bounce_rate'])
-            }
-        ])
+        comparison_df = build_comparison_df(current_metrics, previous_metrics)
 
         # Save to CSV
         client_slug = client_name.lower().replace(' ', '-')
         comparison_df.to_csv(
-            DATA_DIR / f'GA4-organic-{client_slug}.csv',
-            index=False
+            DATA_DIR / f'GA4-organic-{client_slug}.csv.gz',
+            index=False,
+            float_format='%.2f',
+            compression=GZIP_CSV
         )
 
         print(f"   ✅ Data saved for {client_name}")
@@ -14,14 +14,23 @@ Metrics retrieved:
 """
 
 import os
-import pickle
+import json
+import queue
+import orjson
+import threading
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from google.oauth2.credentials import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -30,24 +39,71 @@ from config.settings import (
     GSC_CREDENTIALS_FILE,
     GSC_TOKEN_FILE,
     GSC_SCOPES,
-    DATA_DIR,
     REPORT_LOOKBACK_DAYS,
-    CLIENT_CONFIG_FILE
+    ensure_dirs
 )
+from src.data_collection.client_config import load_client_config
+from src.data_processing.storage import write_frame
+from src.pipeline_log import get_logger
 
+log = get_logger(__name__)
 
-def get_gsc_service():
+# Maximum number of clients fetched concurrently (kept low for GSC quotas)
+MAX_CLIENT_WORKERS = 8
+
+# Retries for 429/5xx responses (exponential backoff)
+GSC_MAX_RETRIES = 5
+
+# REST endpoint for searchanalytics.query (same API the discovery client calls)
+SEARCH_ANALYTICS_URL = (
+    'https://searchconsole.googleapis.com/webmasters/v3/sites/{site}/searchAnalytics/query'
+)
+
+# Largest rowLimit the Search Analytics API accepts; bigger results are paged
+GSC_PAGE_SIZE = 25000
+
+# Follow-up pages requested concurrently once the first page comes back full
+PAGE_PREFETCH = 4
+
+# Search periods fetched as site totals for every client
+AGGREGATE_PERIODS = ('current', 'previous', 'yoy')
+
+# Keep-alive connections held by the shared session: each client worker can
+# have its page prefetch and its aggregate requests in flight at once, and
+# all of them reuse these instead of new TLS handshakes
+SESSION_POOL_SIZE = MAX_CLIENT_WORKERS * (PAGE_PREFETCH + len(AGGREGATE_PERIODS))
+
+
+def _save_token(creds):
+    """
+    Persist OAuth credentials to the token cache file.
+
+    Written to a temp file and renamed into place so a concurrent reader
+    never sees a half-written token.
+    """
+    token_path = Path(GSC_TOKEN_FILE)
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = token_path.with_name(f'{token_path.name}.{os.getpid()}-{threading.get_ident()}.tmp')
+    tmp_path.write_text(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+@lru_cache(maxsize=1)
+def get_gsc_credentials():
     """
-    Authenticate and return GSC API service.
+    Authenticate and return GSC OAuth credentials.
 
-    Uses OAuth2 flow with token caching for subsequent runs.
+    Uses OAuth2 flow with token caching for subsequent runs. The token is
+    stored as authorized-user JSON (not a pickle) and memoized so it is
+    only read once per process.
     """
     creds = None
     token_path = Path(GSC_TOKEN_FILE)
 
     if token_path.exists():
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
+        creds = Credentials.from_authorized_user_info(
+            json.loads(token_path.read_text()), GSC_SCOPES
+        )
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -58,25 +114,122 @@ def get_gsc_service():
             )
             creds = flow.run_local_server(port=0)
 
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+        # Only rewrite the token when it was refreshed or newly issued
+        _save_token(creds)
 
-    return build('searchconsole', 'v1', credentials=creds)
+    return creds
 
 
-def fetch_search_analytics(service, site_url: str, start_date: str, end_date: str,
-                           dimensions: list = None, row_limit: int = 25000) -> pd.DataFrame:
+@lru_cache(maxsize=1)
+def get_authorized_session(creds) -> AuthorizedSession:
+    """
+    Return the requests session that signs every GSC call with creds.
+
+    Shared by all worker threads and all clients so TLS connections are
+    kept alive and reused; the session attaches the bearer token and
+    refreshes it itself on expiry or a 401. 429/5xx responses are retried
+    with exponential backoff.
+    """
+    session = AuthorizedSession(creds)
+    retry = Retry(
+        total=GSC_MAX_RETRIES,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None
+    )
+    session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=SESSION_POOL_SIZE))
+    return session
+
+
+def _search_analytics_body(start_date: str, end_date: str, dimensions: list,
+                           row_limit: int, start_row: int = 0) -> dict:
+    """Build the searchanalytics.query request body for one page of rows."""
+    return {
+        'startDate': start_date,
+        'endDate': end_date,
+        'dimensions': dimensions,
+        'rowLimit': row_limit,
+        'startRow': start_row,
+        'dataState': 'final'
+    }
+
+
+def _post_search_analytics(session, site_url: str, request_body: dict) -> list:
+    """POST one searchanalytics.query request and return its rows."""
+    response = session.post(
+        SEARCH_ANALYTICS_URL.format(site=quote(site_url, safe='')),
+        data=orjson.dumps(request_body),
+        headers={'Content-Type': 'application/json'}
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content).get('rows', [])
+
+
+def _aggregate_body(start_date: str, end_date: str) -> dict:
+    """Build the searchanalytics.query request body for site totals."""
+    return {
+        'startDate': start_date,
+        'endDate': end_date,
+        'dataState': 'final'
+    }
+
+
+def _parse_search_analytics(response: dict, dimensions: list, site_url: str) -> pd.DataFrame:
+    """Convert a searchanalytics.query response into a DataFrame."""
+    if 'rows' not in response:
+        log.warning(f"⚠️ No data returned for {site_url}")
+        return pd.DataFrame()
+
+    rows = response['rows']
+    count = len(rows)
+
+    # Build columns directly instead of one dict per row
+    key_columns = list(zip(*(row['keys'] for row in rows))) if count else []
+    data = {dim: list(key_columns[i]) for i, dim in enumerate(dimensions)}
+    for metric, dtype in (('clicks', np.int64), ('impressions', np.int64),
+                          ('ctr', np.float64), ('position', np.float64)):
+        data[metric] = np.fromiter(
+            (row.get(metric, 0) for row in rows), dtype=dtype, count=count
+        )
+
+    return pd.DataFrame(data)
+
+
+def _parse_aggregate(response: dict) -> dict:
+    """Convert a site-totals searchanalytics.query response into a metrics dict."""
+    if 'rows' in response and len(response['rows']) > 0:
+        row = response['rows'][0]
+        return {
+            'clicks': row.get('clicks', 0),
+            'impressions': row.get('impressions', 0),
+            'ctr': row.get('ctr', 0),
+            'position': row.get('position', 0)
+        }
+
+    return {'clicks': 0, 'impressions': 0, 'ctr': 0, 'position': 0}
+
+
+def fetch_search_analytics(session, site_url: str, start_date: str, end_date: str,
+                           dimensions: list = None, row_limit: int = None) -> pd.DataFrame:
     """
     Fetch search analytics data for a specific site and date range.
 
+    Calls the REST endpoint directly and decodes with orjson; large
+    per-query payloads are dominated by JSON parsing, which is several
+    times faster than the stdlib json path.
+
+    Results are paged with startRow in GSC_PAGE_SIZE chunks until a short
+    page comes back. Once the first page is full, the next PAGE_PREFETCH
+    pages are requested concurrently (GSC orders rows deterministically,
+    so pages can be fetched out of order and stitched back together).
+
     Args:
-        service: GSC API service object
+        session: AuthorizedSession from get_authorized_session()
         site_url: The site URL (e.g., 'https://example.com/')
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
         dimensions: List of dimensions ['date', 'query', 'page', 'country', 'device']
-        row_limit: Maximum rows to retrieve
+        row_limit: Maximum rows to retrieve (None = all rows)
 
     Returns:
         DataFrame with search analytics data
@@ -84,83 +237,130 @@ def fetch_search_analytics(service, site_url: str, start_date: str, end_date: st
     if dimensions is None:
         dimensions = ['query', 'page']
 
-    request_body = {
-        'startDate': start_date,
-        'endDate': end_date,
-        'dimensions': dimensions,
-        'rowLimit': row_limit,
-        'dataState': 'final'
-    }
+    page_size = min(row_limit or GSC_PAGE_SIZE, GSC_PAGE_SIZE)
+
+    def fetch_page(start_row):
+        return _post_search_analytics(session, site_url, _search_analytics_body(
+            start_date, end_date, dimensions, page_size, start_row
+        ))
 
     try:
-        response = service.searchanalytics().query(
-            siteUrl=site_url,
-            body=request_body
-        ).execute()
-
-        if 'rows' not in response:
-            print(f"⚠️ No data returned for {site_url}")
-            return pd.DataFrame()
-
-        rows = response['rows']
-        data = []
-
-        for row in rows:
-            row_data = {}
-            for i, dim in enumerate(dimensions):
-                row_data[dim] = row['keys'][i]
-            row_data['clicks'] = row.get('clicks', 0)
-            row_data['impressions'] = row.get('impressions', 0)
-            row_data['ctr'] = row.get('ctr', 0)
-            row_data['position'] = row.get('position', 0)
-            data.append(row_data)
-
-        return pd.DataFrame(data)
+        rows = fetch_page(0)
+        next_row = page_size
+        last_page_full = len(rows) == page_size
+
+        while last_page_full and (row_limit is None or next_row < row_limit):
+            starts = [next_row + i * page_size for i in range(PAGE_PREFETCH)]
+            if row_limit is not None:
+                starts = [start for start in starts if start < row_limit]
+
+            with ThreadPoolExecutor(max_workers=len(starts)) as executor:
+                pages = list(executor.map(fetch_page, starts))
+
+            for page in pages:
+                rows.extend(page)
+                last_page_full = len(page) == page_size
+                if not last_page_full:
+                    break
+
+            next_row = starts[-1] + page_size
+
+        if row_limit is not None:
+            rows = rows[:row_limit]
+
+        return _parse_search_analytics({'rows': rows} if rows else {}, dimensions, site_url)
 
     except Exception as e:
-        print(f"❌ Error fetching GSC data for {site_url}: {e}")
+        log.error(f"❌ Error fetching GSC data for {site_url}: {e}")
         return pd.DataFrame()
 
 
-def fetch_aggregate_metrics(service, site_url: str, start_date: str, end_date: str) -> dict:
+def fetch_aggregate_metrics(session, site_url: str, start_date: str, end_date: str) -> dict:
     """
     Fetch aggregate metrics (totals) for a site and date range.
 
     Returns:
         dict with total clicks, impressions, avg CTR, avg position
     """
-    request_body = {
-        'startDate': start_date,
-        'endDate': end_date,
-        'dataState': 'final'
-    }
-
     try:
-        response = service.searchanalytics().query(
-            siteUrl=site_url,
-            body=request_body
-        ).execute()
-
-        if 'rows' in response and len(response['rows']) > 0:
-            row = response['rows'][0]
-            return {
-                'clicks': row.get('clicks', 0),
-                'impressions': row.get('impressions', 0),
-                'ctr': row.get('ctr', 0),
-                'position': row.get('position', 0)
-            }
-
-        return {'clicks': 0, 'impressions': 0, 'ctr': 0, 'position': 0}
+        rows = _post_search_analytics(session, site_url, _aggregate_body(start_date, end_date))
+        return _parse_aggregate({'rows': rows})
 
     except Exception as e:
-        print(f"❌ Error fetching aggregate metrics: {e}")
+        log.error(f"❌ Error fetching aggregate metrics: {e}")
         return {'clicks': 0, 'impressions': 0, 'ctr': 0, 'position': 0}
 
 
-def calculate_date_ranges():
-    """Calculate date ranges for 30-day and YoY comparisons."""
-    today = datetime.today()
+def fetch_all_for_client(creds, site_url: str, date_ranges: dict) -> dict:
+    """
+    Fetch every GSC dataset needed for one client.
+
+    The three small aggregate queries (current, previous, YoY) are sent
+    concurrently while the large per-query payload is fetched; all of
+    them go over the shared session's pooled connections.
+
+    Returns:
+        dict with 'current', 'previous' and 'yoy' aggregate metrics and the
+        current-period 'queries' DataFrame
+    """
+    session = get_authorized_session(creds)
+
+    with ThreadPoolExecutor(max_workers=len(AGGREGATE_PERIODS)) as executor:
+        aggregates = {
+            period: executor.submit(
+                fetch_aggregate_metrics, session, site_url, *date_ranges[period]
+            )
+            for period in AGGREGATE_PERIODS
+        }
+
+        results = {
+            'queries': fetch_search_analytics(
+                session, site_url, *date_ranges['current'], dimensions=['query']
+            )
+        }
+
+        for period, future in aggregates.items():
+            results[period] = future.result()
+
+    return results
+
+
+def comparison_values(metrics: dict) -> list:
+    """Return [clicks, impressions, CTR %, position] as floats for a comparison table."""
+    return [
+        float(metrics['clicks']),
+        float(metrics['impressions']),
+        float(metrics['ctr']) * 100,
+        float(metrics['position'])
+    ]
 
+
+def _writer_loop(write_queue: queue.Queue, failed: set):
+    """
+    Write queued (client_name, frame, stem) items until a None arrives.
+
+    Runs on a background thread so disk writes overlap with the API calls
+    still in flight; clients whose files fail to write are added to failed.
+    """
+    while True:
+        item = write_queue.get()
+        try:
+            if item is None:
+                return
+
+            client_name, frame, stem = item
+            try:
+                write_frame(frame, stem)
+            except Exception as e:
+                log.error(f"❌ Error saving {stem}: {e}")
+                failed.add(client_name)
+        finally:
+            write_queue.task_done()
+
+
+@lru_cache(maxsize=1)
+def _compute_date_ranges(today: date) -> dict:
+    """Compute the 30-day and YoY periods relative to the given day."""
     # Current 30 days (ending yesterday for complete data)
     current_end = today - timedelta(days=1)
     current_start = current_end - timedelta(days=REPORT_LOOKBACK_DAYS - 1)
@@ -174,126 +374,151 @@ def calculate_date_ranges():
     yoy_start = current_start.replace(year=current_start.year - 1)
 
     return {
-        'current': (current_start.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')),
-        'previous': (previous_start.strftime('%Y-%m-%d'), previous_end.strftime('%Y-%m-%d')),
-        'yoy': (yoy_start.strftime('%Y-%m-%d'), yoy_end.strftime('%Y-%m-%d'))
+        'current': (current_start.isoformat(), current_end.isoformat()),
+        'previous': (previous_start.isoformat(), previous_end.isoformat()),
+        'yoy': (yoy_start.isoformat(), yoy_end.isoformat())
     }
 
 
-def load_client_config() -> pd.DataFrame:
-    """Load client configuration with site URLs."""
-    config_path = Path(CLIENT_CONFIG_FILE)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Client config not found: {config_path}")
+def calculate_date_ranges() -> dict:
+    """
+    Calculate date ranges for 30-day and YoY comparisons.
 
-    return pd.read_excel(config_path)
+    Cached per calendar day; the returned dict is shared, treat it as
+    read-only.
+    """
+    return _compute_date_ranges(date.today())
 
 
 def run():
     """
     Main execution function for GSC data collection.
 
-    Fetches data for all configured clients and saves to CSV files.
+    Fetches data for all configured clients and saves it in DATA_FORMAT.
     """
-    print("=" * 60)
-    print("🔍 Google Search Console Data Fetcher")
-    print("=" * 60)
+    ensure_dirs()
+
+    log.info("=" * 60)
+    log.info("🔍 Google Search Console Data Fetcher")
+    log.info("=" * 60)
 
     # Load client configuration
     try:
         clients_df = load_client_config()
-        print(f"📋 Loaded {len(clients_df)} clients from config")
+        log.info(f"📋 Loaded {len(clients_df)} clients from config")
     except Exception as e:
         return {'success': False, 'message': f"Failed to load client config: {e}"}
 
-    # Get API service
-    service = get_gsc_service()
+    # Get credentials (shared by every worker through one session)
+    creds = get_gsc_credentials()
 
     # Calculate date ranges
     date_ranges = calculate_date_ranges()
-    print(f"\n📅 Date Ranges:")
-    print(f"   Current: {date_ranges['current'][0]} to {date_ranges['current'][1]}")
-    print(f"   Previous: {date_ranges['previous'][0]} to {date_ranges['previous'][1]}")
-    print(f"   YoY: {date_ranges['yoy'][0]} to {date_ranges['yoy'][1]}")
-
-    results = []
-
-    for _, client in clients_df.iterrows():
+    log.info(f"\n📅 Date Ranges:")
+    log.info(f"   Current: {date_ranges['current'][0]} to {date_ranges['current'][1]}")
+    log.info(f"   Previous: {date_ranges['previous'][0]} to {date_ranges['previous'][1]}")
+    log.info(f"   YoY: {date_ranges['yoy'][0]} to {date_ranges['yoy'][1]}")
+
+    # Collect clients with a configured GSC property
+    targets = []
+    for client in clients_df.to_dict(orient='records'):
         client_name = client.get('client_name', 'Unknown')
         site_url = client.get('gsc_property', '')
 
         if not site_url:
-            print(f"⚠️ Skipping {client_name}: No GSC property configured")
+            log.warning(f"⚠️ Skipping {client_name}: No GSC property configured")
             continue
 
-        print(f"\n🌐 Processing: {client_name}")
-        print(f"   Site: {site_url}")
-
-        # Fetch aggregate metrics for each period
-        current_metrics = fetch_aggregate_metrics(
-            service, site_url,
-            date_ranges['current'][0], date_ranges['current'][1]
-        )
-        previous_metrics = fetch_aggregate_metrics(
-            service, site_url,
-            date_ranges['previous'][0], date_ranges['previous'][1]
-        )
-        yoy_metrics = fetch_aggregate_metrics(
-            service, site_url,
-            date_ranges['yoy'][0], date_ranges['yoy'][1]
-        )
+        targets.append((client_name, site_url))
 
-        # Create comparison DataFrames
-        comparison_30v30 = pd.DataFrame([
-            {'Metric': 'Clicks', 'Current 30 Days': current_metrics['clicks'],
-             'Previous 30 Days': previous_metrics['clicks']},
-            {'Metric': 'Impressions', 'Current 30 Days': current_metrics['impressions'],
-             'Previous 30 Days': previous_metrics['impressions']},
-            {'Metric': 'CTR', 'Current 30 Days': f"{current_metrics['ctr']*100:.2f}%",
-             'Previous 30 Days': f"{previous_metrics['ctr']*100:.2f}%"},
-            {'Metric': 'Position', 'Current 30 Days': f"{current_metrics['position']:.1f}",
-             'Previous 30 Days': f"{previous_metrics['position']:.1f}"}
-        ])
-
-        comparison_yoy = pd.DataFrame([
-            {'Metric': 'Clicks', 'Current Year (30d)': current_metrics['clicks'],
-             'Previous Year (30d)': yoy_metrics['clicks']},
-            {'Metric': 'Impressions', 'Current Year (30d)': current_metrics['impressions'],
-             'Previous Year (30d)': yoy_metrics['impressions']},
-            {'Metric': 'CTR', 'Current Year (30d)': f"{current_metrics['ctr']*100:.2f}%",
-             'Previous Year (30d)': f"{yoy_metrics['ctr']*100:.2f}%"},
-            {'Metric': 'Position', 'Current Year (30d)': f"{current_metrics['position']:.1f}",
-             'Previous Year (30d)': f"{yoy_metrics['position']:.1f}"}
-        ])
-
-        # Save comparison files
-        client_slug = client_name.lower().replace(' ', '-')
-        comparison_30v30.to_csv(
-            DATA_DIR / f'GSC-30vs30-overMonth-{client_slug}.csv',
-            index=False
-        )
-        comparison_yoy.to_csv(
-            DATA_DIR / f'GSC-YOY-overMonth-{client_slug}.csv',
-            index=False
-        )
+    # Frames are written by a background thread while later clients are
+    # still being fetched
+    write_queue = queue.Queue()
+    failed_writes = set()
+    writer = threading.Thread(
+        target=_writer_loop, args=(write_queue, failed_writes), daemon=True
+    )
+    writer.start()
 
-        # Fetch detailed query data for top performers analysis
-        query_data = fetch_search_analytics(
-            service, site_url,
-            date_ranges['current'][0], date_ranges['current'][1],
-            dimensions=['query']
-        )
-        if not query_data.empty:
-            query_data.to_csv(DATA_DIR / f'GSC-queries-{client_slug}.csv', index=False)
+    # Fetch all clients concurrently, each with its own request fan-out
+    max_workers = max(1, min(MAX_CLIENT_WORKERS, len(targets)))
 
-        print(f"   ✅ Data saved for {client_name}")
-        results.append({'client': client_name, 'success': True})
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(fetch_all_for_client, creds, site_url, date_ranges):
+                    (client_name, site_url)
+                for client_name, site_url in targets
+            }
 
-    print(f"\n✅ GSC data collection complete: {len(results)} clients processed")
+            # Queue each client's frames as soon as its fetch finishes
+            for future in as_completed(futures):
+                client_name, site_url = futures[future]
+                client_data = future.result()
+
+                log.info(f"\n🌐 Processing: {client_name}")
+                log.info(f"   Site: {site_url}")
+
+                current_metrics = client_data['current']
+                previous_metrics = client_data['previous']
+                yoy_metrics = client_data['yoy']
+
+                # Create comparison DataFrames (raw numbers: CTR in percent, position
+                # as a float; the report builder formats them for display)
+                metric_names = ['Clicks', 'Impressions', 'CTR', 'Position']
+                current_values = comparison_values(current_metrics)
+                previous_values = comparison_values(previous_metrics)
+                yoy_values = comparison_values(yoy_metrics)
+
+                # All three periods side by side for the comparison calculator
+                aggregates = pd.DataFrame({
+                    'metric': ['clicks', 'impressions', 'ctr', 'position'],
+                    'current': current_values,
+                    'previous': previous_values,
+                    'yoy': yoy_values
+                })
+
+                comparison_30v30 = pd.DataFrame({
+                    'Metric': metric_names,
+                    'Current 30 Days': current_values,
+                    'Previous 30 Days': previous_values
+                })
+
+                comparison_yoy = pd.DataFrame({
+                    'Metric': metric_names,
+                    'Current Year (30d)': current_values,
+                    'Previous Year (30d)': yoy_values
+                })
+
+                # Queue comparison files
+                client_slug = client_name.lower().replace(' ', '-')
+                for frame, stem in ((comparison_30v30, f'GSC-30vs30-overMonth-{client_slug}'),
+                                    (comparison_yoy, f'GSC-YOY-overMonth-{client_slug}'),
+                                    (aggregates, f'aggregates-{client_slug}')):
+                    write_queue.put((client_name, frame, stem))
+
+                # Detailed query data for top performers analysis
+                query_data = client_data['queries']
+                if not query_data.empty:
+                    write_queue.put((client_name, query_data, f'GSC-queries-{client_slug}'))
+    finally:
+        # Wait for every queued frame to reach disk
+        write_queue.put(None)
+        write_queue.join()
+        writer.join()
+
+    results = [
+        {'client': client_name, 'success': client_name not in failed_writes}
+        for client_name, _ in targets
+    ]
+    saved = sum(result['success'] for result in results)
+
+    log.info(f"\n✅ GSC data collection complete: {saved} of {len(results)} clients saved")
 
     return {
-        'success': True,
-        'message': f'Processed {len(results)} clients',
+        'success': not failed_writes,
+        'message': f'Processed {len(results)} clients'
+                   + (f' ({len(failed_writes)} failed to save)' if failed_writes else ''),
         'clients': results
     }
 
@@ -0,0 +1,311 @@
+"""
+Comparison Calculator
+
+Processes the per-client GSC aggregates in a single pass to calculate:
+- Period-over-period (30 vs previous 30 days) growth rates and trends
+- Year-over-year changes with descriptive trend text
+- Consolidated summaries across all clients
+
+Each aggregates file holds the raw current, previous-period and
+same-period-last-year numbers, so both comparisons come from one read
+and share the same vectorized change calculation.
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import DATA_DIR, ensure_dirs
+from src.data_processing.storage import GZIP_CSV, find_frames, frame_slug, read_frame
+from src.pipeline_log import get_logger
+
+log = get_logger(__name__)
+
+# Metrics (in column order) in the consolidated summary files
+SUMMARY_METRICS = ['clicks', 'impressions', 'ctr', 'position']
+
+# Numeric columns of an aggregates frame
+VALUE_COLUMNS = ('current', 'previous', 'yoy')
+
+
+def percent_change(current: np.ndarray, previous: np.ndarray) -> tuple:
+    """
+    Calculate percentage and absolute change for whole columns.
+
+    A zero previous value counts as +100% (or 0% if current is also zero).
+
+    Returns:
+        (change_pct, change_abs) arrays, rounded to 2 decimals
+    """
+    change_abs = current - previous
+    safe_previous = np.where(previous == 0, 1, previous)
+    change_pct = np.where(
+        previous == 0,
+        np.where(current == 0, 0.0, 100.0),
+        change_abs / safe_previous * 100
+    )
+    return np.round(change_pct, 2), np.round(change_abs, 2)
+
+
+def calculate_change(current: np.ndarray, previous: np.ndarray) -> tuple:
+    """
+    Calculate period-over-period change and trend direction.
+
+    Returns:
+        (change_pct, change_abs, trend) arrays
+    """
+    change_pct, change_abs = percent_change(current, previous)
+    trend = np.select([change_pct > 5, change_pct < -5], ['up', 'down'], default='neutral')
+    return change_pct, change_abs, trend
+
+
+def calculate_yoy_change(current: np.ndarray, previous: np.ndarray) -> tuple:
+    """
+    Calculate year-over-year change with five trend buckets.
+
+    Returns:
+        (change_pct, change_abs, trend, trend_text) arrays
+    """
+    change_pct, change_abs = percent_change(current, previous)
+
+    # Metrics with no previous-year value are labelled before the % buckets
+    no_history = previous == 0
+    conditions = [
+        no_history & (current == 0),
+        no_history,
+        change_pct > 20,
+        change_pct > 5,
+        change_pct > -5,
+        change_pct > -20,
+    ]
+
+    trend = np.select(
+        conditions,
+        ['neutral', 'up', 'strong_up', 'up', 'neutral', 'down'],
+        default='strong_down'
+    )
+    trend_text = np.select(
+        conditions,
+        [
+            'No change',
+            'New metric (no previous year data)',
+            'Strong year-over-year growth',
+            'Moderate year-over-year growth',
+            'Stable year-over-year',
+            'Moderate year-over-year decline',
+        ],
+        default='Significant year-over-year decline'
+    )
+
+    return change_pct, change_abs, trend, trend_text
+
+
+def load_aggregates(files: list) -> pd.DataFrame:
+    """Read every aggregates file into one frame with a 'client' column."""
+    frames = []
+    for file_path in files:
+        try:
+            frames.append(
+                read_frame(file_path).assign(client=frame_slug(file_path, 'aggregates-'))
+            )
+        except Exception as e:
+            log.error(f"❌ Error processing {file_path}: {e}")
+
+    if not frames:
+        return pd.DataFrame(columns=['metric', 'current', 'previous', 'yoy', 'client'])
+
+    # One vectorized coercion per column (covers CSV copies with stray
+    # text such as a trailing '%') instead of per-value type checks
+    df = pd.concat(frames, ignore_index=True)
+    for col in VALUE_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col].astype(str).str.rstrip('%'), errors='coerce')
+    return df
+
+
+def calculate_comparisons(df: pd.DataFrame) -> tuple:
+    """
+    Compute growth and YoY metrics for every client in one vectorized pass.
+
+    Returns:
+        (growth, yoy) dicts of {client_slug: {metric: {...}}}
+    """
+    current = df['current'].to_numpy(dtype=float)
+    previous = df['previous'].to_numpy(dtype=float)
+    last_year = df['yoy'].to_numpy(dtype=float)
+
+    growth_pct, growth_abs, growth_trend = calculate_change(current, previous)
+    yoy_pct, yoy_abs, yoy_trend, yoy_text = calculate_yoy_change(current, last_year)
+
+    growth = {}
+    yoy = {}
+
+    for client, rows in df.groupby('client', sort=False).indices.items():
+        growth[client] = {}
+        yoy[client] = {}
+
+        for i in rows:
+            metric = df['metric'].iat[i]
+            growth[client][metric] = {
+                'current': float(current[i]),
+                'previous': float(previous[i]),
+                'change_pct': float(growth_pct[i]),
+                'change_abs': float(growth_abs[i]),
+                'trend': str(growth_trend[i])
+            }
+            yoy[client][metric] = {
+                'current_year': float(current[i]),
+                'previous_year': float(last_year[i]),
+                'change_pct': float(yoy_pct[i]),
+                'change_abs': float(yoy_abs[i]),
+                'trend': str(yoy_trend[i]),
+                'trend_text': str(yoy_text[i])
+            }
+
+    return growth, yoy
+
+
+def generate_summary_text(metrics: dict, client_name: str) -> str:
+    """Generate a human-readable summary of the metrics."""
+    lines = [f"Performance Summary for {client_name}:"]
+
+    if 'clicks' in metrics:
+        m = metrics['clicks']
+        trend_emoji = '📈' if m['trend'] == 'up' else '📉' if m['trend'] == 'down' else '➡️'
+        lines.append(f"{trend_emoji} Clicks: {int(m['current']):,} ({m['change_pct']:+.1f}%)")
+
+    if 'impressions' in metrics:
+        m = metrics['impressions']
+        trend_emoji = '📈' if m['trend'] == 'up' else '📉' if m['trend'] == 'down' else '➡️'
+        lines.append(f"{trend_emoji} Impressions: {int(m['current']):,} ({m['change_pct']:+.1f}%)")
+
+    if 'ctr' in metrics:
+        m = metrics['ctr']
+        trend_emoji = '📈' if m['trend'] == 'up' else '📉' if m['trend'] == 'down' else '➡️'
+        lines.append(f"{trend_emoji} CTR: {m['current']:.2f}% ({m['change_pct']:+.1f}%)")
+
+    if 'position' in metrics:
+        m = metrics['position']
+        # For position, lower is better
+        trend_emoji = '📈' if m['trend'] == 'down' else '📉' if m['trend'] == 'up' else '➡️'
+        lines.append(f"{trend_emoji} Avg Position: {m['current']:.1f} ({-m['change_pct']:+.1f}%)")
+
+    return '\n'.join(lines)
+
+
+def generate_yoy_summary(metrics: dict, client_name: str) -> str:
+    """Generate human-readable YoY summary."""
+    lines = [f"Year-over-Year Summary for {client_name}:"]
+    lines.append("-" * 40)
+
+    for metric_name, data in metrics.items():
+        icon = '🟢' if 'up' in data['trend'] else '🔴' if 'down' in data['trend'] else '🟡'
+        display_name = metric_name.replace('_', ' ').title()
+        lines.append(f"{icon} {display_name}: {data['change_pct']:+.1f}%")
+        lines.append(f"   {data['trend_text']}")
+
+    return '\n'.join(lines)
+
+
+def run():
+    """
+    Main execution function.
+
+    Calculates growth and YoY metrics for all clients from their GSC
+    aggregates.
+    """
+    ensure_dirs()
+
+    log.info("=" * 60)
+    log.info("📊 Growth & Year-over-Year Comparison Calculator")
+    log.info("=" * 60)
+
+    # Find all GSC aggregates files
+    aggregate_files = find_frames('aggregates-')
+    log.info(f"📁 Found {len(aggregate_files)} GSC aggregates files")
+
+    all_growth, all_yoy = calculate_comparisons(load_aggregates(aggregate_files))
+
+    for client_slug, growth_metrics in all_growth.items():
+        yoy_metrics = all_yoy[client_slug]
+        client_name = client_slug.replace('-', ' ').title()
+
+        log.info(f"\n📈 Processing: {client_slug}")
+        log.info(generate_summary_text(growth_metrics, client_name))
+        log.info(generate_yoy_summary(yoy_metrics, client_name))
+
+        # Save detailed metrics
+        growth_df = pd.DataFrame([
+            {
+                'metric': name,
+                'current': data['current'],
+                'previous': data['previous'],
+                'change_pct': data['change_pct'],
+                'change_abs': data['change_abs'],
+                'trend': data['trend']
+            }
+            for name, data in growth_metrics.items()
+        ])
+        growth_df.to_csv(
+            DATA_DIR / f'growth-metrics-{client_slug}.csv.gz',
+            index=False,
+            compression=GZIP_CSV
+        )
+
+        yoy_df = pd.DataFrame([
+            {
+                'metric': name,
+                'current_year': data['current_year'],
+                'previous_year': data['previous_year'],
+                'change_pct': data['change_pct'],
+                'trend': data['trend'],
+                'trend_text': data['trend_text']
+            }
+            for name, data in yoy_metrics.items()
+        ])
+        yoy_df.to_csv(
+            DATA_DIR / f'yoy-metrics-{client_slug}.csv.gz',
+            index=False,
+            compression=GZIP_CSV
+        )
+
+    # Save consolidated summaries (one column list per field, filled client by client)
+    growth_summary = {'client': list(all_growth)}
+    yoy_summary = {'client': list(all_growth)}
+    for metric_name in SUMMARY_METRICS:
+        growth_summary[f'{metric_name}_current'] = []
+        growth_summary[f'{metric_name}_change'] = []
+        growth_summary[f'{metric_name}_trend'] = []
+        yoy_summary[f'{metric_name}_yoy_change'] = []
+        yoy_summary[f'{metric_name}_trend'] = []
+
+    for client, metrics in all_growth.items():
+        client_yoy = all_yoy[client]
+        for metric_name in SUMMARY_METRICS:
+            data = metrics.get(metric_name, {})
+            growth_summary[f'{metric_name}_current'].append(data.get('current'))
+            growth_summary[f'{metric_name}_change'].append(data.get('change_pct'))
+            growth_summary[f'{metric_name}_trend'].append(data.get('trend'))
+
+            data = client_yoy.get(metric_name, {})
+            yoy_summary[f'{metric_name}_yoy_change'].append(data.get('change_pct'))
+            yoy_summary[f'{metric_name}_trend'].append(data.get('trend'))
+
+    if all_growth:
+        pd.DataFrame(growth_summary).to_csv(DATA_DIR / 'growth-summary-all-clients.csv', index=False)
+        pd.DataFrame(yoy_summary).to_csv(DATA_DIR / 'yoy-summary-all-clients.csv', index=False)
+
+    log.info(f"\n✅ Growth and YoY metrics calculated for {len(all_growth)} clients")
+
+    return {
+        'success': True,
+        'message': f'Processed {len(all_growth)} clients',
+        'clients': list(all_growth.keys())
+    }
+
+
+if __name__ == '__main__':
+    run()
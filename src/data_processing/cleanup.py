@@ -7,16 +7,23 @@ Moves old files to backup directory for safety.
 
 import os
 import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from config.settings import DATA_DIR, REPORTS_DIR, GRAPHS_DIR, BASE_DIR
+from config.settings import (
+    DATA_DIR, REPORTS_DIR, GRAPHS_DIR, BASE_DIR, ensure_dirs
+)
+from src.pipeline_log import get_logger
+
+log = get_logger(__name__)
 
 # File extensions to clean up
-CLEANUP_EXTENSIONS = ['.csv', '.json', '.html', '.png', '.xlsx']
+CLEANUP_EXTENSIONS = ['.csv', '.gz', '.parquet', '.json', '.html', '.png', '.xlsx', '.hash']
 
 # Directories to clean (their contents will be moved to backup)
 CLEANUP_DIRS = [DATA_DIR, REPORTS_DIR, GRAPHS_DIR]
@@ -28,6 +35,50 @@ PRESERVED_FILES = [
     'template.html',
 ]
 
+# Number of files moved concurrently
+MAX_WORKERS = 8
+
+
+def backup_name(name: str, existing: set, counters: defaultdict) -> str:
+    """
+    Return a collision-free backup file name.
+
+    existing holds every name already in (or queued for) the backup
+    directory, listed once up front, so no per-candidate stat is needed.
+    Colliding names get _1, _2, ... appended to the stem, continuing from
+    the last suffix handed out for that name. The chosen name is added
+    to existing.
+    """
+    candidate = name
+    if candidate in existing:
+        path = Path(name)
+        while candidate in existing:
+            counters[name] += 1
+            candidate = f"{path.stem}_{counters[name]}{path.suffix}"
+
+    existing.add(candidate)
+    return candidate
+
+
+def move_file(src: Path, dest: Path):
+    """
+    Move src into the backup at dest.
+
+    Hardlinks the file into place and then unlinks the original: two
+    metadata operations with no data copied, whatever the file size.
+    Falls back to shutil.move (copy + delete) where hardlinks aren't
+    possible: across filesystems, or on mounts without hardlink support
+    (SMB, FAT, some FUSE filesystems). An existing dest is still an error.
+    """
+    try:
+        os.link(src, dest)
+    except FileExistsError:
+        raise
+    except OSError:
+        shutil.move(str(src), str(dest))
+        return
+    src.unlink()
+
 
 def run():
     """
@@ -35,27 +86,32 @@ def run():
 
     Moves old data files to backup directory before new pipeline run.
     """
-    print("=" * 60)
-    print("🧹 Cleanup Module")
-    print("=" * 60)
+    ensure_dirs()
+
+    log.info("=" * 60)
+    log.info("🧹 Cleanup Module")
+    log.info("=" * 60)
 
     # Create backup directory with timestamp
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_dir = BASE_DIR / 'backups' / f'backup_{timestamp}'
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    files_moved = 0
+    moves = []
+    queued = set()
+    existing = set(os.listdir(backup_dir))
+    counters = defaultdict(int)
     files_skipped = 0
 
     for cleanup_dir in CLEANUP_DIRS:
         cleanup_path = Path(cleanup_dir)
 
         if not cleanup_path.exists():
-            print(f"📁 Creating directory: {cleanup_path}")
+            log.info(f"📁 Creating directory: {cleanup_path}")
             cleanup_path.mkdir(parents=True, exist_ok=True)
             continue
 
-        print(f"\n📂 Cleaning: {cleanup_path}")
+        log.info(f"\n📂 Cleaning: {cleanup_path}")
 
         for item in cleanup_path.iterdir():
             # Skip directories (process files only at this level)
@@ -64,40 +120,37 @@ def run():
 
             # Check if file should be preserved
             if item.name in PRESERVED_FILES:
-                print(f"   ⏭️ Preserved: {item.name}")
+                log.info(f"   ⏭️ Preserved: {item.name}")
                 files_skipped += 1
                 continue
 
             # Check if file extension matches cleanup list
             if item.suffix.lower() in CLEANUP_EXTENSIONS:
-                dest_path = backup_dir / item.name
-
-                # Handle duplicate filenames
-                if dest_path.exists():
-                    base = dest_path.stem
-                    suffix = dest_path.suffix
-                    counter = 1
-                    while dest_path.exists():
-                        dest_path = backup_dir / f"{base}_{counter}{suffix}"
-                        counter += 1
-
-                shutil.move(str(item), str(dest_path))
-                print(f"   📦 Moved: {item.name}")
-                files_moved += 1
+                moves.append((item, backup_dir / backup_name(item.name, existing, counters)))
+                queued.add(item)
 
     # Clean up graphs subdirectory
     if GRAPHS_DIR.exists():
         for item in GRAPHS_DIR.iterdir():
-            if item.is_file() and item.suffix.lower() == '.png':
-                dest_path = backup_dir / 'graphs' / item.name
-                dest_path.parent.mkdir(exist_ok=True)
-                shutil.move(str(item), str(dest_path))
-                files_moved += 1
-
-    print(f"\n✅ Cleanup complete:")
-    print(f"   Files moved to backup: {files_moved}")
-    print(f"   Files preserved: {files_skipped}")
-    print(f"   Backup location: {backup_dir}")
+            if item.is_file() and item.suffix.lower() == '.png' and item not in queued:
+                (backup_dir / 'graphs').mkdir(exist_ok=True)
+                moves.append((item, backup_dir / 'graphs' / item.name))
+
+    # Move everything in parallel
+    def move(pair):
+        move_file(*pair)
+        return pair[0]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for src in executor.map(move, moves):
+            log.info(f"   📦 Moved: {src.name}")
+
+    files_moved = len(moves)
+
+    log.info(f"\n✅ Cleanup complete:")
+    log.info(f"   Files moved to backup: {files_moved}")
+    log.info(f"   Files preserved: {files_skipped}")
+    log.info(f"   Backup location: {backup_dir}")
 
     return {
         'success': True,
@@ -8,13 +8,63 @@ Analyzes keyword/query data to identify:
 - At-risk keywords
 """
 
+import numpy as np
 import pandas as pd
+import polars as pl
 from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from config.settings import DATA_DIR
+from config.settings import DATA_DIR, ensure_dirs
+from src.data_processing.storage import (
+    find_frames, frame_slug, write_records_csv
+)
+from src.pipeline_log import get_logger
+
+log = get_logger(__name__)
+
+# Columns read from the GSC query files
+QUERY_COLUMNS = ['query', 'clicks', 'impressions', 'ctr', 'position']
+
+# Parse types for CSV query files (per-query counts fit in 32 bits)
+QUERY_SCHEMA = {
+    'query': pl.String,
+    'clicks': pl.Int32,
+    'impressions': pl.Int32,
+    'ctr': pl.Float64,
+    'position': pl.Float64,
+}
+
+# Rows kept for each top-queries table
+TOP_QUERIES = 5
+
+# Search positions just off page 1 that count as opportunities
+OPPORTUNITY_POSITIONS = (11, 20)
+
+
+def top_k_indices(values: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """
+    Return the positions of the k largest (or smallest) entries of values.
+
+    Ordered like nlargest/nsmallest: by value, ties in original order.
+    np.partition finds the k-th value in O(N), so only the k selected
+    entries are ever sorted.
+    """
+    if not largest:
+        values = -values
+
+    if k >= len(values):
+        return np.argsort(-values, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth = np.partition(values, len(values) - k)[len(values) - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - len(above)]
+
+    selected = np.concatenate([above, ties])
+    return selected[np.argsort(-values[selected], kind='stable')]
 
 
 def identify_growth_leaders(df: pd.DataFrame, metric: str = 'impressions',
@@ -31,131 +81,184 @@ def identify_growth_leaders(df: pd.DataFrame, metric: str = 'impressions',
     Returns:
         DataFrame with top performers
     """
-    # Calculate change
-    df = df.copy()
-    df['change'] = df[f'{metric}_current'] - df[f'{metric}_previous']
-    df['change_pct'] = (df['change'] / df[f'{metric}_previous'].replace(0, 1)) * 100
-
-    # Sort based on direction
-    if direction == 'growth':
-        df_sorted = df.nlargest(top_n, 'change')
-    else:
-        df_sorted = df.nsmallest(top_n, 'change')
+    current_col = f'{metric}_current'
+    previous_col = f'{metric}_previous'
+
+    # Calculate change on the raw arrays and pick rows from it directly
+    previous = df[previous_col].to_numpy()
+    change = df[current_col].to_numpy() - previous
+    idx = top_k_indices(change, top_n, largest=(direction == 'growth'))
 
-    return df_sorted[['query', f'{metric}_current', f'{metric}_previous', 'change', 'change_pct']]
+    # Percent change only for the selected rows (a zero previous value counts as 1)
+    selected_previous = previous[idx]
+    return df.iloc[idx][['query', current_col, previous_col]].assign(
+        change=change[idx],
+        change_pct=change[idx] / np.where(selected_previous == 0, 1, selected_previous) * 100
+    )
 
 
-def analyze_position_opportunities(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+def top_queries(queries: pl.LazyFrame, column: str, columns: list,
+                n: int = TOP_QUERIES) -> pl.LazyFrame:
     """
-    Identify keywords close to page 1 (positions 11-20) with high impressions.
+    Return the n queries with the largest values in column.
 
-    These represent opportunities for quick wins with optimization.
+    Ties keep file order (like nlargest); polars turns the sort + head
+    into a top-k selection.
     """
-    df = df.copy()
+    return queries.sort(
+        [column, 'row'], descending=[True, False]
+    ).head(n).select(columns)
 
-    # Filter for positions 11-20 (just off page 1)
-    opportunity_df = df[
-        (df['position'] >= 11) &
-        (df['position'] <= 20) &
-        (df['impressions'] > df['impressions'].median())
-    ]
 
-    # Sort by impressions (highest first)
-    return opportunity_df.nlargest(top_n, 'impressions')[
-        ['query', 'position', 'impressions', 'clicks', 'ctr']
-    ]
+def scan_queries(file_path: Path) -> pl.LazyFrame:
+    """Lazily scan a query file (Parquet or CSV) with a row index column."""
+    if file_path.suffix == '.parquet':
+        queries = pl.scan_parquet(file_path)
+    else:
+        queries = pl.scan_csv(file_path, schema_overrides=QUERY_SCHEMA)
+    return queries.select(QUERY_COLUMNS).with_row_index('row')
+
+
+def analyze_position_opportunities(queries: pl.LazyFrame, top_n: int = 10) -> pl.LazyFrame:
+    """
+    Identify keywords close to page 1 (positions 11-20) with high impressions.
+
+    These represent opportunities for quick wins with optimization.
+    "High" means above the median impressions of all queries in the file.
+
+    Args:
+        queries: Query rows (with a 'row' index column) to search
+        top_n: Number of results to return
+    """
+    low, high = OPPORTUNITY_POSITIONS
+    return top_queries(
+        queries.filter(
+            pl.col('position').is_between(low, high)
+            & (pl.col('impressions') > pl.col('impressions').median())
+        ),
+        'impressions',
+        ['query', 'position', 'impressions', 'clicks', 'ctr'],
+        top_n
+    )
 
 
 def process_query_data(file_path: Path) -> dict:
-    """Process query data file and extract insights."""
-    try:
-        df = pd.read_csv(file_path)
+    """
+    Process query data file and extract insights.
 
-        # Standardize column names
-        df.columns = [col.lower().strip() for col in df.columns]
+    The totals, both top-5 tables and the opportunities are built as lazy
+    queries over one scan and collected together, so the file is parsed
+    once (multithreaded) and only the needed columns are read.
+    """
+    try:
+        queries = scan_queries(file_path)
 
-        results = {
-            'total_queries': len(df),
-            'total_clicks': int(df['clicks'].sum()) if 'clicks' in df.columns else 0,
-            'total_impressions': int(df['impressions'].sum()) if 'impressions' in df.columns else 0,
-        }
+        totals, top_clicks, top_impressions, opportunities = pl.collect_all([
+            queries.select(
+                pl.len().alias('total_queries'),
+                pl.col('clicks').cast(pl.Int64).sum().alias('total_clicks'),
+                pl.col('impressions').cast(pl.Int64).sum().alias('total_impressions'),
+            ),
+            top_queries(queries, 'clicks', ['query', 'clicks', 'impressions', 'position']),
+            top_queries(queries, 'impressions', ['query', 'impressions', 'clicks', 'position']),
+            analyze_position_opportunities(queries),
+        ])
 
-        # Top queries by clicks
-        if 'clicks' in df.columns:
-            top_clicks = df.nlargest(5, 'clicks')[['query', 'clicks', 'impressions', 'position']]
-            results['top_by_clicks'] = top_clicks.to_dict('records')
+        results = totals.row(0, named=True)
 
-        # Top queries by impressions
-        if 'impressions' in df.columns:
-            top_impressions = df.nlargest(5, 'impressions')[['query', 'impressions', 'clicks', 'position']]
-            results['top_by_impressions'] = top_impressions.to_dict('records')
+        # Top queries by clicks and impressions
+        results['top_by_clicks'] = top_clicks.to_dicts()
+        results['top_by_impressions'] = top_impressions.to_dicts()
 
         # Position opportunities
-        if 'position' in df.columns:
-            opportunities = analyze_position_opportunities(df)
-            if not opportunities.empty:
-                results['opportunities'] = opportunities.to_dict('records')
+        if opportunities.height:
+            results['opportunities'] = opportunities.to_dicts()
 
         return results
 
     except Exception as e:
-        print(f"❌ Error processing {file_path}: {e}")
+        log.error(f"❌ Error processing {file_path}: {e}")
         return {}
 
 
+def analyze_client(file_path: Path) -> tuple:
+    """
+    Analyse one client's query file and write its top-performer files.
+
+    Returns:
+        (client_slug, summary) where summary holds the totals and the
+        number of opportunities, or is empty if the file could not be read
+    """
+    client_slug = frame_slug(file_path, 'GSC-queries-')
+    results = process_query_data(file_path)
+
+    if not results:
+        return client_slug, {}
+
+    # Save top performers
+    if 'top_by_clicks' in results:
+        write_records_csv(
+            results['top_by_clicks'],
+            DATA_DIR / f'top-queries-clicks-{client_slug}.csv'
+        )
+
+    if 'top_by_impressions' in results:
+        write_records_csv(
+            results['top_by_impressions'],
+            DATA_DIR / f'top-queries-impressions-{client_slug}.csv'
+        )
+
+    if 'opportunities' in results:
+        write_records_csv(
+            results['opportunities'],
+            DATA_DIR / f'keyword-opportunities-{client_slug}.csv'
+        )
+
+    return client_slug, {
+        'total_queries': results['total_queries'],
+        'total_clicks': results['total_clicks'],
+        'total_impressions': results['total_impressions'],
+        'opportunities': len(results.get('opportunities', []))
+    }
+
+
 def run():
     """
     Main execution function.
 
     Processes query data for all clients and identifies top performers.
+    Files are analysed one at a time; polars spreads each file's scan
+    and aggregations across all cores.
     """
-    print("=" * 60)
-    print("🎯 Top Performers Identifier")
-    print("=" * 60)
+    ensure_dirs()
+
+    log.info("=" * 60)
+    log.info("🎯 Top Performers Identifier")
+    log.info("=" * 60)
 
     # Find all query data files
-    query_files = list(DATA_DIR.glob('GSC-queries-*.csv'))
-    print(f"📁 Found {len(query_files)} query data files")
+    query_files = find_frames('GSC-queries-')
+    log.info(f"📁 Found {len(query_files)} query data files")
 
     all_results = {}
 
     for file_path in query_files:
-        client_slug = file_path.stem.replace('GSC-queries-', '')
-        print(f"\n🔍 Analyzing: {client_slug}")
-
-        results = process_query_data(file_path)
-
-        if results:
-            all_results[client_slug] = results
-
-            print(f"   📊 Total queries: {results.get('total_queries', 0):,}")
-            print(f"   🖱️ Total clicks: {results.get('total_clicks', 0):,}")
-            print(f"   👁️ Total impressions: {results.get('total_impressions', 0):,}")
-
-            # Save top performers
-            if 'top_by_clicks' in results:
-                top_clicks_df = pd.DataFrame(results['top_by_clicks'])
-                top_clicks_df.to_csv(
-                    DATA_DIR / f'top-queries-clicks-{client_slug}.csv',
-                    index=False
-                )
-
-            if 'top_by_impressions' in results:
-                top_impr_df = pd.DataFrame(results['top_by_impressions'])
-                top_impr_df.to_csv(
-                    DATA_DIR / f'top-queries-impressions-{client_slug}.csv',
-                    index=False
-                )
-
-            if 'opportunities' in results:
-                opp_df = pd.DataFrame(results['opportunities'])
-                opp_df.to_csv(
-                    DATA_DIR / f'keyword-opportunities-{client_slug}.csv',
-                    index=False
-                )
-                print(f"   🎯 Found {len(results['opportunities'])} keyword opportunities")
-
-    print(f"\n✅ Top performers identified for {len(all_results)} clients")
+        client_slug, summary = analyze_client(file_path)
+        log.info(f"\n🔍 Analyzing: {client_slug}")
+
+        if not summary:
+            continue
+
+        all_results[client_slug] = summary
+
+        log.info(f"   📊 Total queries: {summary['total_queries']:,}")
+        log.info(f"   🖱️ Total clicks: {summary['total_clicks']:,}")
+        log.info(f"   👁️ Total impressions: {summary['total_impressions']:,}")
+
+        if summary['opportunities']:
+            log.info(f"   🎯 Found {summary['opportunities']} keyword opportunities")
+
+    log.info(f"\n✅ Top performers identified for {len(all_results)} clients")
 
     return {
         'success': True,
@@ -0,0 +1,159 @@
+"""
+Intermediate Data Storage
+
+Read/write helpers for the DataFrames handed between pipeline stages
+(GSC comparison tables and per-query data).
+
+DATA_FORMAT selects the on-disk format:
+- parquet (default): typed, columnar, zstd-compressed; no float -> string
+  -> float round trip and no dtype inference on read
+- csv: plain text, written with pyarrow's C++ CSV writer
+
+Readers accept either format, so files left by older runs still load.
+"""
+
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+from functools import lru_cache
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import DATA_DIR, DATA_FORMAT
+
+# Suffixes the readers recognise, preferred (written) format first
+SUFFIXES = ('.csv', '.parquet') if DATA_FORMAT == 'csv' else ('.parquet', '.csv')
+
+# to_csv compression for gzipped CSVs: no timestamp in the gzip header, so
+# identical data gives identical bytes (and an unchanged input digest)
+GZIP_CSV = {'method': 'gzip', 'mtime': 0}
+
+
+def data_path(stem: str) -> Path:
+    """Return the DATA_DIR path a frame named stem is written to."""
+    return DATA_DIR / f'{stem}{SUFFIXES[0]}'
+
+
+def write_frame(df: pd.DataFrame, stem: str) -> Path:
+    """
+    Write df to DATA_DIR in the configured DATA_FORMAT.
+
+    Args:
+        df: DataFrame to write (the index is not stored)
+        stem: File name without extension (e.g. 'GSC-queries-acme')
+
+    Returns:
+        Path of the written file
+    """
+    path = data_path(stem)
+
+    if path.suffix == '.parquet':
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        pv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            str(path),
+            pv.WriteOptions(quoting_style='needed')
+        )
+
+    return path
+
+
+def write_records_csv(records: list, path: Path) -> Path:
+    """
+    Write a list of row dicts to path as CSV with pyarrow's C++ writer.
+
+    Used for small report tables that are always CSV regardless of
+    DATA_FORMAT. Same dialect as write_frame's CSV output: string columns
+    are quoted, integral floats are written without a trailing '.0'.
+    """
+    pv.write_csv(
+        pa.Table.from_pylist(records),
+        str(path),
+        pv.WriteOptions(quoting_style='needed')
+    )
+    return path
+
+
+def read_frame(path: Path, columns: list = None, dtype: dict = None) -> pd.DataFrame:
+    """
+    Read a frame written by write_frame (Parquet or CSV, by suffix).
+
+    Args:
+        path: Frame file
+        columns: Only read these columns (CSV headers are matched with
+            surrounding whitespace ignored); columns the file lacks are
+            skipped rather than raising
+        dtype: CSV parse dtypes (Parquet files are already typed)
+    """
+    if Path(path).suffix == '.parquet':
+        if columns is not None:
+            available = set(pq.read_schema(path).names)
+            columns = [col for col in columns if col in available]
+        return pd.read_parquet(path, engine='pyarrow', columns=columns)
+
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+
+        def wanted_column(name):
+            return name.strip() in wanted
+
+        usecols = wanted_column
+    return pd.read_csv(path, usecols=usecols, dtype=dtype, engine='c')
+
+
+def find_frame(stem: str):
+    """Return the existing file for stem (preferred format first), or None."""
+    for suffix in SUFFIXES:
+        path = DATA_DIR / f'{stem}{suffix}'
+        if path.exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=4)
+def _scan(data_dir: Path, mtime_ns: int) -> dict:
+    """List data_dir once per directory mtime, grouping file names by suffix."""
+    groups = {suffix: [] for suffix in SUFFIXES}
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix in groups and entry.is_file():
+                groups[suffix].append(entry.name)
+    return groups
+
+
+def scan_data_dir() -> dict:
+    """
+    Return DATA_DIR's frame files as {suffix: [file names]}.
+
+    The listing is cached and keyed on the directory's mtime, so the
+    processors share one os.scandir per pipeline stage while still seeing
+    files written by earlier stages (adding a file bumps the mtime).
+    """
+    return _scan(DATA_DIR, os.stat(DATA_DIR).st_mtime_ns)
+
+
+def find_frames(prefix: str) -> list:
+    """
+    Find every frame whose name starts with prefix.
+
+    When a stem exists in both formats only the preferred one is returned.
+    """
+    groups = scan_data_dir()
+    found = {}
+    for suffix in reversed(SUFFIXES):
+        for name in groups[suffix]:
+            if name.startswith(prefix):
+                found[name[:-len(suffix)]] = DATA_DIR / name
+    return sorted(found.values())
+
+
+def frame_slug(path: Path, prefix: str) -> str:
+    """Return the client slug from a frame path, e.g. 'GSC-queries-acme.parquet' -> 'acme'."""
+    return path.name[len(prefix):-len(path.suffix)]
@@ -0,0 +1,40 @@
+"""
+Directory Listing
+
+One os.scandir pass per lookup for the modules that pick up files left
+by earlier pipeline steps (reports, graphs, metrics, run reports).
+scandir returns each entry's type with the directory read, so matching
+by name costs no per-file stat calls, unlike Path.glob, which is
+noticeable when the project lives on a network share.
+
+Usage in a module:
+    from src.file_scan import list_files
+    html_files = list_files(REPORTS_DIR, suffix='.html')
+"""
+
+import os
+from pathlib import Path
+
+
+def list_files(directory: Path, prefix: str = '', suffix='') -> list:
+    """
+    List the regular files in directory matching prefix and suffix.
+
+    Args:
+        directory: Directory to scan (a missing directory yields [])
+        prefix: Required start of the file name
+        suffix: Required end of the file name, or a tuple of alternatives
+
+    Returns:
+        Sorted list of Paths
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
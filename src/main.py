@@ -21,10 +21,12 @@ Usage:
 
 import os
 import sys
-import json
 import yaml
+import time
+import orjson
 import logging
 import argparse
+import importlib
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -33,6 +35,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import BASE_DIR, REPORTS_DIR, DATA_DIR
+from src.pipeline_log import flush_logs
 
 # Configure logging
 logging.basicConfig(
@@ -55,9 +58,8 @@ PIPELINE_STEPS = {
         'data_collection.fetch_ga4_data',
     ],
     'data_processing': [
-        'data_processing.calculate_growth_metrics',
+        'data_processing.calculate_comparisons',
         'data_processing.identify_top_performers',
-        'data_processing.calculate_yoy_comparison',
     ],
     'analysis': [
         'analysis.gpt_summary_writer',
@@ -74,6 +76,36 @@ PIPELINE_STEPS = {
 }
 
 
+# Pipeline modules imported so far, keyed by dot-notation name
+_MODULE_CACHE = {}
+
+
+def load_module(module_name: str):
+    """Import src.<module_name> (once per process) and return the module."""
+    module = _MODULE_CACHE.get(module_name)
+    if module is None:
+        module = importlib.import_module(f"src.{module_name}")
+        _MODULE_CACHE[module_name] = module
+    return module
+
+
+def preload_modules(pipeline_steps: dict) -> dict:
+    """
+    Import every module in pipeline_steps before any step runs.
+
+    Returns:
+        dict of {module_name: error message} for modules that failed to import
+    """
+    errors = {}
+    for modules in pipeline_steps.values():
+        for module_name in modules:
+            try:
+                load_module(module_name)
+            except Exception as e:
+                errors[module_name] = str(e)
+    return errors
+
+
 def load_pipeline_config(config_file: str = None) -> dict:
     """Load pipeline configuration from YAML file."""
     if config_file is None:
@@ -98,10 +130,10 @@ def run_module(module_name: str, dry_run: bool = False) -> dict:
     Returns:
         dict with 'success', 'duration', and 'message' keys
     """
-    start_time = datetime.now()
+    start = time.perf_counter()
 
     if dry_run:
-        logger.info(f"[DRY RUN] Would execute: {module_name}")
+        logger.info("[DRY RUN] Would execute: %s", module_name)
         return {
             'success': True,
             'duration': 0,
@@ -109,19 +141,22 @@ def run_module(module_name: str, dry_run: bool = False) -> dict:
         }
 
     try:
-        logger.info(f"▶️ Starting: {module_name}")
+        logger.info("▶️ Starting: %s", module_name)
 
-        # Import and run the module
-        module_path = f"src.{module_name}"
-        module = __import__(module_path, fromlist=['run'])
+        # Import (cached) and run the module
+        module = load_module(module_name)
 
         if hasattr(module, 'run'):
-            result = module.run()
+            try:
+                result = module.run()
+            finally:
+                # Write the module's buffered console output at the step boundary
+                flush_logs()
         else:
             result = {'success': True, 'message': 'Module executed (no run function)'}
 
-        duration = (datetime.now() - start_time).total_seconds()
-        logger.info(f"✅ Completed: {module_name} ({duration:.2f}s)")
+        duration = time.perf_counter() - start
+        logger.info("✅ Completed: %s (%.2fs)", module_name, duration)
 
         return {
             'success': True,
@@ -130,8 +165,8 @@ def run_module(module_name: str, dry_run: bool = False) -> dict:
         }
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        logger.error(f"❌ Failed: {module_name} - {str(e)}")
+        duration = time.perf_counter() - start
+        logger.error("❌ Failed: %s - %s", module_name, e)
 
         return {
             'success': False,
@@ -151,6 +186,7 @@ def run_pipeline(steps: list = None, dry_run: bool = False) -> dict:
     Returns:
         dict with pipeline execution results
     """
+    start = time.perf_counter()
     start_time = datetime.now()
     results = {
         'start_time': start_time.isoformat(),
@@ -171,6 +207,16 @@ def run_pipeline(steps: list = None, dry_run: bool = False) -> dict:
     logger.info(f"   Dry Run: {dry_run}")
     logger.info("=" * 60)
 
+    # Import every module up front so a broken import fails before any step runs
+    if not dry_run:
+        import_errors = preload_modules(pipeline_steps)
+        if import_errors:
+            for module_name, error in import_errors.items():
+                logger.error(f"❌ Import failed: {module_name} - {error}")
+            results['success'] = False
+            results['import_errors'] = import_errors
+            pipeline_steps = {}
+
     for step_name, modules in pipeline_steps.items():
         logger.info(f"\n📋 Step: {step_name}")
         logger.info("-" * 40)
@@ -196,10 +242,9 @@ def run_pipeline(steps: list = None, dry_run: bool = False) -> dict:
             'modules': step_results
         }
 
-    # Calculate total duration
-    end_time = datetime.now()
-    results['end_time'] = end_time.isoformat()
-    results['total_duration'] = (end_time - start_time).total_seconds()
+    # Calculate total duration (monotonic clock; wall-clock only for the timestamps)
+    results['end_time'] = datetime.now().isoformat()
+    results['total_duration'] = time.perf_counter() - start
 
     # Log summary
     logger.info("\n" + "=" * 60)
@@ -217,8 +262,7 @@ def run_pipeline(steps: list = None, dry_run: bool = False) -> dict:
     report_file = BASE_DIR / 'logs' / f'pipeline_report_{datetime.now():%Y%m%d_%H%M%S}.json'
     report_file.parent.mkdir(exist_ok=True)
 
-    with open(report_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    report_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"   Report saved: {report_file}")
 
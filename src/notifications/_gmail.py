@@ -0,0 +1,68 @@
+"""
+Gmail API Service
+
+Shared Gmail authentication for the notification modules. The draft
+creator and the status email sender run back to back in the pipeline,
+so the credentials are loaded and the service is built once per
+process and reused.
+
+The Google client libraries are imported on first use, so importing
+the notification modules (dry runs, steps with nothing to send) does
+not pay for them.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import GMAIL_CREDENTIALS_FILE, GMAIL_TOKEN_FILE, GMAIL_SCOPES
+
+
+def _save_token(creds):
+    """Persist OAuth credentials to the token cache file (atomic replace)."""
+    token_path = Path(GMAIL_TOKEN_FILE)
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = token_path.with_name(f'{token_path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+@lru_cache(maxsize=1)
+def get_gmail_service():
+    """
+    Authenticate and return the shared Gmail API service.
+
+    Uses OAuth2 flow with token caching; the token is stored as
+    authorized-user JSON (not a pickle). The service is built from the
+    discovery document bundled with google-api-python-client, so no
+    discovery request is made.
+    """
+    from google.auth.transport.requests import Request
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
+    creds = None
+    token_path = Path(GMAIL_TOKEN_FILE)
+
+    if token_path.exists():
+        creds = Credentials.from_authorized_user_file(str(token_path), GMAIL_SCOPES)
+
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                GMAIL_CREDENTIALS_FILE, GMAIL_SCOPES
+            )
+            creds = flow.run_local_server(port=0)
+
+        _save_token(creds)
+
+    return build(
+        'gmail', 'v1', credentials=creds,
+        static_discovery=True, cache_discovery=False
+    )
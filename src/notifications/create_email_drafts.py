@@ -8,101 +8,171 @@ Uses Gmail API with OAuth2 authentication.
 """
 
 import os
+import csv
 import base64
-import pickle
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from premailer import transform
-
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from config.settings import (
-    GMAIL_CREDENTIALS_FILE, GMAIL_TOKEN_FILE, GMAIL_SCOPES,
-    REPORTS_DIR, EMAIL_RECIPIENTS_FILE
+    REPORTS_DIR, EMAIL_RECIPIENTS_FILE, INLINE_CSS_MAX_CHARS, ensure_dirs
 )
+from src.file_scan import list_files
+from src.notifications._gmail import get_gmail_service
+
+# Draft requests sent per Gmail batch call (Gmail advises at most 50)
+GMAIL_BATCH_SIZE = 50
+
+# Distinct report documents whose inlined HTML is kept in memory
+INLINE_CACHE_SIZE = 16
 
+# Worker processes for CSS inlining (one report per task)
+MAX_WORKERS = os.cpu_count() or 1
 
-def get_gmail_service():
+
+@lru_cache(maxsize=1)
+def shared_premailer():
     """
-    Authenticate and return Gmail API service.
+    Return the Premailer instance reused for every document in this process.
 
-    Uses OAuth2 flow with token caching.
+    Settings are fixed and parsed stylesheets are cached, so one instance
+    serves all reports instead of a new one per transform() call.
     """
-    creds = None
-    token_path = Path(GMAIL_TOKEN_FILE)
+    from premailer import Premailer
+    return Premailer(disable_link_rewrites=True, cache_css_parsing=True)
 
-    if token_path.exists():
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                GMAIL_CREDENTIALS_FILE, GMAIL_SCOPES
-            )
-            creds = flow.run_local_server(port=0)
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def inline_css(html_content: str) -> str:
+    """
+    Inline CSS for email client compatibility (original HTML on failure).
 
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+    Premailer output depends only on the input HTML, so results are
+    memoized and each report document is inlined at most once. Premailer
+    (and cssutils/lxml behind it) is imported only when there is a
+    report to inline. Documents over INLINE_CSS_MAX_CHARS are sent as-is,
+    since premailer's selector matching grows with CSS size x DOM size.
+    """
+    if len(html_content) > INLINE_CSS_MAX_CHARS:
+        print(f"⚠️ Skipping CSS inlining: {len(html_content):,} chars exceeds {INLINE_CSS_MAX_CHARS:,}")
+        return html_content
 
-    return build('gmail', 'v1', credentials=creds)
+    try:
+        return shared_premailer().transform(html_content, pretty_print=False)
+    except Exception as e:
+        print(f"⚠️ CSS inlining failed: {e}")
+        return html_content
 
 
-def create_message(to: str, subject: str, html_content: str) -> dict:
+def inline_report(report_path: str) -> str:
+    """Read one report file and return its CSS-inlined HTML (runs in a worker)."""
+    return inline_css(Path(report_path).read_text(encoding='utf-8'))
+
+
+def inline_reports(report_files: list) -> dict:
     """
-    Create an email message for Gmail API.
+    Inline CSS for several reports at once, returning {path: html}.
 
-    Args:
-        to: Recipient email address
-        subject: Email subject line
-        html_content: HTML body content
+    Premailer is CPU-bound, so reports are spread across worker
+    processes; a single report is inlined in-process to skip the pool
+    start-up.
+    """
+    paths = [str(path) for path in report_files]
+    if len(paths) <= 1:
+        return {path: inline_report(path) for path in paths}
 
-    Returns:
-        dict with 'raw' key containing base64-encoded message
+    with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as executor:
+        return dict(zip(paths, executor.map(inline_report, paths)))
+
+
+def build_mime_message(subject: str, inlined_html: str) -> MIMEText:
     """
-    message = MIMEMultipart('alternative')
-    message['to'] = to
-    message['subject'] = subject
+    Build the MIME message for one report, without a recipient yet.
 
-    # Inline CSS for email client compatibility
-    try:
-        inlined_html = transform(html_content)
-    except Exception as e:
-        print(f"⚠️ CSS inlining failed: {e}")
-        inlined_html = html_content
+    The report is the only part, so it is sent as a single text/html
+    message (no multipart wrapper or boundary). The body is encoded once
+    here; encode_message() only swaps the 'to' header for each recipient.
+    """
+    message = MIMEText(inlined_html, 'html', _charset='utf-8')
+    message['to'] = ''
+    message['subject'] = subject
+    return message
 
-    html_part = MIMEText(inlined_html, 'html', _charset='utf-8')
-    message.attach(html_part)
 
+def encode_message(message: MIMEText, to: str) -> dict:
+    """Address message to one recipient and encode it for the Gmail API."""
+    message.replace_header('to', to)
     raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
     return {'raw': raw_message}
 
 
-def save_draft(service, message: dict) -> dict:
-    """Save message as a draft in Gmail."""
-    return service.users().drafts().create(
-        userId='me',
-        body={'message': message}
-    ).execute()
+def save_drafts(service, messages: list) -> int:
+    """
+    Save (email, message) pairs as Gmail drafts using batch requests.
+
+    Up to GMAIL_BATCH_SIZE drafts go out in one HTTP call instead of one
+    round trip per draft.
+
+    Returns:
+        Number of drafts created
+    """
+    created = 0
+
+    def on_response(request_id, response, exception):
+        nonlocal created
+        email = messages[int(request_id)][0]
+        if exception is not None:
+            print(f"   ❌ Failed for {email}: {exception}")
+        else:
+            print(f"   ✅ Draft created for: {email}")
+            created += 1
+
+    for start in range(0, len(messages), GMAIL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_response)
+        for index in range(start, min(start + GMAIL_BATCH_SIZE, len(messages))):
+            batch.add(
+                service.users().drafts().create(
+                    userId='me',
+                    body={'message': messages[index][1]}
+                ),
+                request_id=str(index)
+            )
+
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"   ❌ Draft batch failed: {e}")
+
+    return created
 
 
-def load_recipients() -> pd.DataFrame:
-    """Load recipient configuration from CSV."""
+def load_recipients() -> list:
+    """Load recipient configuration from CSV as a list of row dicts."""
     recipients_path = Path(EMAIL_RECIPIENTS_FILE)
     if recipients_path.exists():
-        return pd.read_csv(recipients_path)
-    return pd.DataFrame()
+        with open(recipients_path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    return []
+
+
+def client_key(client_name: str) -> str:
+    """Normalize a client name for matching ('Acme-Co' and 'acme co' match)."""
+    return client_name.lower().replace('-', ' ').strip()
+
+
+def group_recipients(recipients: list) -> dict:
+    """Return {client_key: [email, ...]} from the recipient rows in one pass."""
+    grouped = {}
+    for row in recipients:
+        email = (row.get('email') or '').strip()
+        if email:
+            grouped.setdefault(client_key(row.get('client_name') or ''), []).append(email)
+    return grouped
 
 
 def run():
@@ -111,12 +181,14 @@ def run():
 
     Creates email drafts for all generated reports.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("📧 Email Draft Creator")
     print("=" * 60)
 
     # Check for reports
-    html_files = list(REPORTS_DIR.glob('*.html'))
+    html_files = list_files(REPORTS_DIR, suffix='.html')
     print(f"📁 Found {len(html_files)} HTML reports")
 
     if not html_files:
@@ -126,14 +198,16 @@ def run():
         }
 
     # Load recipients configuration
-    recipients_df = load_recipients()
-    if recipients_df.empty:
+    recipients = load_recipients()
+    if not recipients:
         print("⚠️ No recipients configured")
         return {
             'success': False,
             'message': 'No recipients configured'
         }
 
+    recipients_by_client = group_recipients(recipients)
+
     # Get Gmail service
     try:
         service = get_gmail_service()
@@ -145,7 +219,7 @@ def run():
         }
 
     current_week = datetime.today().isocalendar()[1]
-    drafts_created = 0
+    jobs = []
 
     for report_file in html_files:
         # Extract client name from filename
@@ -157,31 +231,32 @@ def run():
         print(f"\n📝 Processing: {client_name}")
 
         # Find recipients for this client
-        client_recipients = recipients_df[
-            recipients_df['client_name'].str.lower() == client_name.lower()
-        ]
+        client_recipients = recipients_by_client.get(client_key(client_name), [])
 
-        if client_recipients.empty:
+        if not client_recipients:
             print(f"   ⚠️ No recipients found for {client_name}")
             continue
 
-        # Read report content
-        with open(report_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        jobs.append((report_file, client_name, client_recipients))
 
-        # Create drafts for each recipient
-        for _, recipient in client_recipients.iterrows():
-            email = recipient['email']
-            subject = f"Weekly SEO Update - {client_name} - Week {current_week}"
+    # Inline CSS for every report with recipients in parallel, once per report
+    inlined = inline_reports([report_file for report_file, _, _ in jobs])
+    messages = []
 
+    for report_file, client_name, client_recipients in jobs:
+        subject = f"Weekly SEO Update - {client_name} - Week {current_week}"
+        mime_message = build_mime_message(subject, inlined[str(report_file)])
+
+        # Build a draft for each recipient (sent in batches below)
+        for email in client_recipients:
             try:
-                msg = create_message(email, subject, html_content)
-                draft = save_draft(service, msg)
-                print(f"   ✅ Draft created for: {email}")
-                drafts_created += 1
+                messages.append((email, encode_message(mime_message, email)))
             except Exception as e:
                 print(f"   ❌ Failed for {email}: {e}")
 
+    print(f"\n📤 Saving {len(messages)} drafts")
+    drafts_created = save_drafts(service, messages)
+
     print(f"\n✅ Created {drafts_created} email drafts")
 
     return {
@@ -6,50 +6,18 @@ Includes summary of processed clients and any errors encountered.
 """
 
 import os
-import json
+import orjson
 import base64
-import pickle
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 from datetime import datetime
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from config.settings import (
-    GMAIL_CREDENTIALS_FILE, GMAIL_TOKEN_FILE, GMAIL_SCOPES,
-    STATUS_RECIPIENT, BASE_DIR
-)
-
-
-def get_gmail_service():
-    """Authenticate and return Gmail API service."""
-    creds = None
-    token_path = Path(GMAIL_TOKEN_FILE)
-
-    if token_path.exists():
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                GMAIL_CREDENTIALS_FILE, GMAIL_SCOPES
-            )
-            creds = flow.run_local_server(port=0)
-
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
-
-    return build('gmail', 'v1', credentials=creds)
+from config.settings import STATUS_RECIPIENT, BASE_DIR, ensure_dirs
+from src.file_scan import list_files
+from src.notifications._gmail import get_gmail_service
 
 
 def load_latest_report() -> dict:
@@ -59,12 +27,11 @@ def load_latest_report() -> dict:
         return {}
 
     # Find most recent pipeline report
-    report_files = sorted(logs_dir.glob('pipeline_report_*.json'), reverse=True)
+    report_files = list_files(logs_dir, 'pipeline_report_', '.json')
     if not report_files:
         return {}
 
-    with open(report_files[0], 'r') as f:
-        return json.load(f)
+    return orjson.loads(report_files[-1].read_bytes())
 
 
 def build_status_email(report: dict) -> tuple:
@@ -84,79 +51,65 @@ def build_status_email(report: dict) -> tuple:
 
     subject = f"{status_emoji} Friday Reports Pipeline - Week {current_week}"
 
-    # Build HTML body
-    html_parts = [
-        "<html><body style='font-family: Arial, sans-serif; max-width: 600px; margin: auto;'>",
-        f"<h2>{status_emoji} Friday Reports Pipeline Status</h2>",
-        f"<p><strong>Date:</strong> {current_date}</p>",
-        f"<p><strong>Week:</strong> {current_week}</p>",
-        f"<p><strong>Status:</strong> {status_text}</p>",
-    ]
-
-    # Add timing info
+    # Optional timing line
+    duration_block = ''
     if 'total_duration' in report:
         duration = report['total_duration']
         minutes = int(duration // 60)
         seconds = int(duration % 60)
-        html_parts.append(f"<p><strong>Duration:</strong> {minutes}m {seconds}s</p>")
-
-    # Add step summary
-    html_parts.append("<h3>Step Summary</h3>")
-    html_parts.append("<table style='border-collapse: collapse; width: 100%;'>")
-    html_parts.append("<tr style='background-color: #003366; color: white;'>")
-    html_parts.append("<th style='padding: 8px; text-align: left;'>Step</th>")
-    html_parts.append("<th style='padding: 8px; text-align: center;'>Status</th>")
-    html_parts.append("</tr>")
-
-    for step_name, step_data in report.get('steps', {}).items():
-        step_success = step_data.get('success', False)
-        icon = "✅" if step_success else "❌"
-        bg_color = "#f8f9fa" if step_success else "#fff3f3"
-
-        html_parts.append(f"<tr style='background-color: {bg_color};'>")
-        html_parts.append(f"<td style='padding: 8px; border: 1px solid #ddd;'>{step_name}</td>")
-        html_parts.append(f"<td style='padding: 8px; border: 1px solid #ddd; text-align: center;'>{icon}</td>")
-        html_parts.append("</tr>")
-
-    html_parts.append("</table>")
-
-    # Add error details if any
-    errors = []
-    for step_name, step_data in report.get('steps', {}).items():
-        for module in step_data.get('modules', []):
-            if not module.get('success', True):
-                errors.append({
-                    'step': step_name,
-                    'module': module.get('module', 'Unknown'),
-                    'error': module.get('message', 'Unknown error')
-                })
-
-    if errors:
-        html_parts.append("<h3>⚠️ Errors Encountered</h3>")
-        html_parts.append("<ul>")
-        for error in errors:
-            html_parts.append(f"<li><strong>{error['step']}/{error['module']}:</strong> {error['error']}</li>")
-        html_parts.append("</ul>")
-
-    # Footer
-    html_parts.append("<hr style='margin-top: 30px;'>")
-    html_parts.append("<p style='font-size: 12px; color: #666;'>")
-    html_parts.append("This is an automated status email from the Friday Reports Pipeline.")
-    html_parts.append("</p>")
-    html_parts.append("</body></html>")
-
-    return subject, '\n'.join(html_parts)
+        duration_block = f"\n<p><strong>Duration:</strong> {minutes}m {seconds}s</p>"
+
+    steps = report.get('steps', {})
+
+    # Step summary rows
+    step_rows = ''.join(
+        f"\n<tr style='background-color: {'#f8f9fa' if step_data.get('success', False) else '#fff3f3'};'>"
+        f"\n<td style='padding: 8px; border: 1px solid #ddd;'>{step_name}</td>"
+        f"\n<td style='padding: 8px; border: 1px solid #ddd; text-align: center;'>"
+        f"{'✅' if step_data.get('success', False) else '❌'}</td>"
+        "\n</tr>"
+        for step_name, step_data in steps.items()
+    )
+
+    # Error details for failed modules, if any
+    error_items = ''.join(
+        f"\n<li><strong>{step_name}/{module.get('module', 'Unknown')}:</strong> "
+        f"{module.get('message', 'Unknown error')}</li>"
+        for step_name, step_data in steps.items()
+        for module in step_data.get('modules', [])
+        if not module.get('success', True)
+    )
+    errors_block = (
+        f"\n<h3>⚠️ Errors Encountered</h3>\n<ul>{error_items}\n</ul>" if error_items else ''
+    )
+
+    html_body = f"""<html><body style='font-family: Arial, sans-serif; max-width: 600px; margin: auto;'>
+<h2>{status_emoji} Friday Reports Pipeline Status</h2>
+<p><strong>Date:</strong> {current_date}</p>
+<p><strong>Week:</strong> {current_week}</p>
+<p><strong>Status:</strong> {status_text}</p>{duration_block}
+<h3>Step Summary</h3>
+<table style='border-collapse: collapse; width: 100%;'>
+<tr style='background-color: #003366; color: white;'>
+<th style='padding: 8px; text-align: left;'>Step</th>
+<th style='padding: 8px; text-align: center;'>Status</th>
+</tr>{step_rows}
+</table>{errors_block}
+<hr style='margin-top: 30px;'>
+<p style='font-size: 12px; color: #666;'>
+This is an automated status email from the Friday Reports Pipeline.
+</p>
+</body></html>"""
+
+    return subject, html_body
 
 
 def send_email(service, to: str, subject: str, html_body: str) -> dict:
     """Send an email via Gmail API."""
-    message = MIMEMultipart('alternative')
+    message = MIMEText(html_body, 'html', _charset='utf-8')
     message['to'] = to
     message['subject'] = subject
 
-    html_part = MIMEText(html_body, 'html', _charset='utf-8')
-    message.attach(html_part)
-
     raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
     return service.users().messages().send(
@@ -171,6 +124,8 @@ def run():
 
     Sends status email notification.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("📬 Status Email Sender")
     print("=" * 60)
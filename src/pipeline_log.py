@@ -0,0 +1,51 @@
+"""
+Pipeline Console Logging
+
+Buffered console output for the pipeline modules. Progress lines are
+collected in a MemoryHandler and written to stdout in batches (when the
+buffer fills, on an error, or when a step finishes) instead of one
+flushed write per line, which matters when stdout is a pipe to a cron
+log.
+
+Usage in a module:
+    from src.pipeline_log import get_logger
+    log = get_logger(__name__)
+    log.info("📊 Processing ...")
+"""
+
+import sys
+import logging
+from logging.handlers import MemoryHandler
+
+# Parent logger for all module output (kept out of main's timestamped log)
+CONSOLE_LOGGER = 'friday_reports'
+
+# Number of records buffered before they are written to stdout
+BUFFER_CAPACITY = 100
+
+
+def _configure() -> MemoryHandler:
+    """Attach the shared buffered stdout handler to the parent logger."""
+    parent = logging.getLogger(CONSOLE_LOGGER)
+    parent.setLevel(logging.INFO)
+    parent.propagate = False
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+
+    handler = MemoryHandler(BUFFER_CAPACITY, flushLevel=logging.ERROR, target=stream)
+    parent.addHandler(handler)
+    return handler
+
+
+_HANDLER = _configure()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a module logger writing through the shared console buffer."""
+    return logging.getLogger(f'{CONSOLE_LOGGER}.{name}')
+
+
+def flush_logs():
+    """Write out any buffered console output (call at step boundaries)."""
+    _HANDLER.flush()
@@ -0,0 +1,57 @@
+"""
+Output Freshness Cache
+
+Lets the report builder and graph generator skip outputs whose inputs
+have not changed. A BLAKE2b digest of everything an output is built from
+(input file bytes, summary text, template/style version) is stored next
+to the output as <output>.hash; a later run that computes the same digest
+while the output is still in place reuses it instead of rebuilding.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Suffix of the digest file written next to each output
+HASH_SUFFIX = '.hash'
+
+# Stand-in for an input file that does not exist (distinct from an empty file)
+MISSING = b'\x00missing'
+
+
+def input_digest(*parts) -> str:
+    """
+    Return the hex digest of parts.
+
+    Paths are hashed by content (MISSING if the file does not exist or is
+    None); everything else by its str(). Each part is length-prefixed so
+    adjacent parts cannot run together.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        if part is None:
+            data = MISSING
+        elif isinstance(part, Path):
+            data = part.read_bytes() if part.exists() else MISSING
+        else:
+            data = str(part).encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def hash_path(output_path: Path) -> Path:
+    """Return the digest file stored alongside output_path."""
+    return output_path.with_name(output_path.name + HASH_SUFFIX)
+
+
+def is_fresh(output_path: Path, digest: str) -> bool:
+    """Return True if output_path exists and was built from inputs with this digest."""
+    try:
+        return output_path.exists() and hash_path(output_path).read_text() == digest
+    except FileNotFoundError:
+        return False
+
+
+def mark_fresh(output_path: Path, digest: str):
+    """Record that output_path was built from inputs with this digest."""
+    hash_path(output_path).write_text(digest)
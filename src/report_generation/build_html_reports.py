@@ -7,23 +7,34 @@ Assembles complete HTML reports from:
 - Generated graphs
 - Template styling
 
-Reports are styled for email delivery with inline CSS.
+Reports are styled for email delivery with inline CSS. The stylesheet is
+the same for every report, so premailer runs once per process on a small
+sample document and the style attributes it produces are written straight
+into each report's tags.
+
+Run on its own from the project root with
+`python -m src.report_generation.build_html_reports`.
 """
 
 import os
 import json
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from html import escape
 from pathlib import Path
-from premailer import transform
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from lxml import html as lxml_html
+from premailer import Premailer
 
 from config.settings import (
     DATA_DIR, REPORTS_DIR, GRAPHS_DIR, TEMPLATES_DIR,
-    IMAGE_HOST_URL, CLIENT_CONFIG_FILE
+    IMAGE_HOST_URL, INLINE_CSS_MAX_CHARS, ensure_dirs
 )
+from src.data_processing.storage import find_frame, find_frames, frame_slug, read_frame
+from src.report_generation._output_cache import input_digest, is_fresh, mark_fresh
 
 
 # Section headers with emojis for visual appeal
@@ -36,6 +47,57 @@ SECTION_HEADERS = {
     "resources": "🧰 Additional Resources"
 }
 
+# One element of each styled kind in a report, tagged with data-style, that
+# premailer inlines once to learn the attributes it adds to each kind
+STYLE_SKELETON = """<html><head><style>{css}</style></head><body data-style="body">
+<h1 data-style="h1"></h1>
+<h2 data-style="h2"></h2>
+<div class="summary-box" data-style="summary"></div>
+<table class="dataframe seo-table" data-style="table"><thead><tr><th data-style="th"></th></tr></thead>
+<tbody><tr><td data-style="td"></td></tr></tbody></table>
+<img src="#" class="seo-graph" alt="" data-style="graph">
+<div class="footer" data-style="footer"></div>
+</body></html>"""
+
+# Columns shown in each GSC comparison table (anything else in the file is not read)
+COMPARISON_COLUMNS = {
+    '30v30': ['Metric', 'Current 30 Days', 'Previous 30 Days'],
+    'yoy': ['Metric', 'Current Year (30d)', 'Previous Year (30d)'],
+}
+
+# Data file prefix of each comparison table type
+COMPARISON_PREFIXES = {
+    '30v30': 'GSC-30vs30-overMonth-',
+    'yoy': 'GSC-YOY-overMonth-',
+}
+
+# Worker processes building client reports in parallel
+MAX_WORKERS = os.cpu_count() or 1
+
+# Skeleton attributes that are not produced by inlining
+SKELETON_ATTRIBUTES = {'data-style', 'class', 'src', 'alt'}
+
+# Whole report document; *_style fields are inlined style attributes and the
+# summary/table fields are optional fragments ending in a newline (or empty)
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html><head>
+<meta charset="utf-8">
+<title>Weekly SEO Update - {client_name}</title>
+{head_style}</head><body{body_style}>
+<h1{h1_style}>Weekly Update {client_name} SEO – Week {current_week}</h1>
+<p><em>Report generated: {current_date}</em></p>
+<h2{h2_style}>{headers[30v30]}</h2>
+{summary_30v30}{table_30v30}<img src="{graph_url_30v30}" class="seo-graph" alt="30-Day Comparison Chart"{graph_style}>
+<h2{h2_style}>{headers[yoy]}</h2>
+{summary_yoy}{table_yoy}<img src="{graph_url_yoy}" class="seo-graph" alt="Year-over-Year Chart"{graph_style}>
+<h2{h2_style}>{headers[ga4]}</h2>
+{ga4_section}
+<div class="footer"{footer_style}>
+<p>This report was automatically generated on {current_date}.</p>
+<p>For questions about this report, please contact your SEO team.</p>
+</div>
+</body></html>"""
+
 
 def get_css_styles():
     """Return CSS styles for the report."""
@@ -103,8 +165,48 @@ def get_css_styles():
     """
 
 
+@lru_cache(maxsize=1)
+def shared_premailer() -> Premailer:
+    """
+    Return the Premailer instance reused for every transform in this process.
+
+    The report CSS stays in the document's <style> block (premailer's
+    css_text option would mark the leftover :nth-child rule !important).
+    """
+    return Premailer(disable_link_rewrites=True, cache_css_parsing=True)
+
+
+@lru_cache(maxsize=1)
+def report_styles() -> dict:
+    """
+    Inline the report CSS once and return the attributes for each element.
+
+    Returns:
+        {element: ' style="..." ...'} for each data-style key of
+        STYLE_SKELETON, plus 'head' with the rules premailer leaves in the
+        <style> block (e.g. :nth-child). Empty if inlining failed, in which
+        case build_report falls back to running premailer per report.
+    """
+    try:
+        skeleton = STYLE_SKELETON.format(css=get_css_styles())
+        doc = lxml_html.fromstring(shared_premailer().transform(skeleton, pretty_print=False))
+    except Exception as e:
+        print(f"⚠️ CSS inlining failed: {e}")
+        return {}
+
+    styles = {'head': ''.join(style.text or '' for style in doc.iter('style'))}
+    for element in doc.iterfind('.//*[@data-style]'):
+        styles[element.get('data-style')] = ''.join(
+            f' {name}="{escape(value)}"'
+            for name, value in element.attrib.items()
+            if name not in SKELETON_ATTRIBUTES
+        )
+    return styles
+
+
+@lru_cache(maxsize=None)
 def load_summary(client_slug: str, summary_type: str) -> str:
-    """Load GPT-generated summary from file."""
+    """Load GPT-generated summary from file (memoized for the run)."""
     summary_file = DATA_DIR / f'summary-{summary_type}-{client_slug}.txt'
     if summary_file.exists():
         with open(summary_file, 'r') as f:
@@ -112,40 +214,150 @@ def load_summary(client_slug: str, summary_type: str) -> str:
     return ""
 
 
+def format_gsc_comparison(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format a raw GSC comparison table for display.
+
+    Counts are shown as whole numbers, CTR as a percentage with two
+    decimals and position with one decimal. Each value column is
+    formatted as a whole, so one call can cover many clients' rows.
+    """
+    metric = df['Metric'].str.lower()
+    is_ctr = metric.eq('ctr').fillna(False).to_numpy(dtype=bool)
+    is_position = metric.eq('position').fillna(False).to_numpy(dtype=bool)
+
+    display_df = df.copy()
+    for col in display_df.columns[1:]:
+        values = df[col].astype(float).to_numpy()
+        text = np.char.mod('%.0f', values).astype(object)
+        text[is_ctr] = np.char.mod('%.2f%%', values[is_ctr])
+        text[is_position] = np.char.mod('%.1f', values[is_position])
+        display_df[col] = text
+    return display_df
+
+
+@lru_cache(maxsize=None)
+def comparison_tables(data_type: str) -> dict:
+    """
+    Load and format every client's comparison table of one type together.
+
+    Files with the expected columns and numeric values are concatenated
+    and formatted in one pass, then split per client. Files that can't
+    join the batch are left to load_comparison_data, which reads them on
+    their own (and reports their errors).
+
+    Returns:
+        {client_slug: display DataFrame} (shared, treat as read-only)
+    """
+    prefix = COMPARISON_PREFIXES[data_type]
+    columns = COMPARISON_COLUMNS[data_type]
+
+    frames = {}
+    for file_path in find_frames(prefix):
+        try:
+            df = read_frame(file_path, columns=columns, dtype={'Metric': 'string'})
+        except Exception:
+            continue
+        if list(df.columns) == columns and all(
+            pd.api.types.is_numeric_dtype(df[col]) for col in columns[1:]
+        ):
+            frames[frame_slug(file_path, prefix)] = df
+
+    if not frames:
+        return {}
+
+    batch = format_gsc_comparison(pd.concat(frames))
+    return {
+        client_slug: table.reset_index(drop=True)
+        for client_slug, table in batch.groupby(level=0, sort=False)
+    }
+
+
+@lru_cache(maxsize=None)
 def load_comparison_data(client_slug: str, data_type: str) -> pd.DataFrame:
-    """Load comparison data from CSV."""
-    if data_type == '30v30':
-        file_path = DATA_DIR / f'GSC-30vs30-overMonth-{client_slug}.csv'
-    elif data_type == 'yoy':
-        file_path = DATA_DIR / f'GSC-YOY-overMonth-{client_slug}.csv'
-    elif data_type == 'ga4':
-        file_path = DATA_DIR / f'GA4-organic-{client_slug}.csv'
-    else:
+    """
+    Load comparison data, formatted for display.
+
+    Memoized for the run; the returned DataFrame is shared, treat it as
+    read-only.
+    """
+    if data_type == 'ga4':
+        file_path = DATA_DIR / f'GA4-organic-{client_slug}.csv.gz'
+        if file_path.exists():
+            return pd.read_csv(file_path)
+        return pd.DataFrame()
+    if data_type not in COMPARISON_PREFIXES:
         return pd.DataFrame()
 
-    if file_path.exists():
-        return pd.read_csv(file_path)
+    table = comparison_tables(data_type).get(client_slug)
+    if table is not None:
+        return table
+
+    file_path = find_frame(f'{COMPARISON_PREFIXES[data_type]}{client_slug}')
+    if file_path is not None:
+        return format_gsc_comparison(read_frame(
+            file_path,
+            columns=COMPARISON_COLUMNS[data_type],
+            dtype={'Metric': 'string'}
+        ))
     return pd.DataFrame()
 
 
+def string_table_html(df: pd.DataFrame, styles: dict) -> str:
+    """
+    Render an all-text DataFrame as the same markup df.to_html produces.
+
+    The display tables are a few rows of pre-formatted strings, so the
+    rows are joined directly instead of going through pandas' formatter.
+    Missing cells are shown as 'NaN', as pandas does.
+    """
+    th = f'<th{styles.get("th", "")}>'
+    td = f'<td{styles.get("td", "")}>'
+    lines = [
+        f'<table class="dataframe seo-table"{styles.get("table", "")}>',
+        '  <thead>',
+        '    <tr style="text-align: center;">',
+    ]
+    lines.extend(f'      {th}{column}</th>' for column in df.columns)
+    lines.extend(['    </tr>', '  </thead>', '  <tbody>'])
+    for row in df.itertuples(index=False, name=None):
+        lines.append('    <tr>')
+        lines.extend(
+            f'      {td}{"NaN" if pd.isna(value) else value}</td>' for value in row
+        )
+        lines.append('    </tr>')
+    lines.extend(['  </tbody>', '</table>'])
+    return '\n'.join(lines)
+
+
 def df_to_html_table(df: pd.DataFrame) -> str:
-    """Convert DataFrame to styled HTML table."""
+    """Convert DataFrame to styled HTML table (inline styles on each cell)."""
     if df.empty:
         return "<p><em>No data available</em></p>"
 
-    return df.to_html(
+    styles = report_styles()
+
+    # The formatted GSC tables are all text; anything else (GA4 numbers)
+    # keeps pandas' number formatting
+    if all(pd.api.types.is_string_dtype(dtype) for dtype in df.dtypes):
+        return string_table_html(df, styles)
+
+    table_html = df.to_html(
         index=False,
         border=0,
         classes='seo-table',
         escape=False,
         justify='center'
     )
+    return table_html.replace(
+        '<table class="dataframe seo-table">',
+        f'<table class="dataframe seo-table"{styles.get("table", "")}>',
+        1
+    ).replace('<th>', f'<th{styles.get("th", "")}>').replace('<td>', f'<td{styles.get("td", "")}>')
 
 
-def get_graph_url(client_slug: str, graph_type: str) -> str:
+def get_graph_url(client_slug: str, graph_type: str, current_week: int) -> str:
     """Generate URL for hosted graph image."""
-    current_week = datetime.today().isocalendar()[1]
-
     if graph_type == '30v30':
         filename = f'GSC-30vs30-week{current_week}-{client_slug}.png'
     else:  # yoy
@@ -154,103 +366,140 @@ def get_graph_url(client_slug: str, graph_type: str) -> str:
     return f"{IMAGE_HOST_URL}{filename}"
 
 
-def build_report(client_name: str, client_slug: str) -> str:
+def build_report(client_name: str, client_slug: str,
+                 current_week: int, current_date: str) -> str:
     """
     Build complete HTML report for a client.
 
     Args:
         client_name: Display name for the client
         client_slug: URL-safe client identifier
+        current_week: ISO week number shown in the report
+        current_date: Generation date as displayed (e.g. 'October 15, 2026')
 
     Returns:
         Complete HTML report string
     """
-    current_week = datetime.today().isocalendar()[1]
-    current_date = datetime.today().strftime('%B %d, %Y')
-
-    # Start building HTML
-    html_parts = [
-        "<!DOCTYPE html>",
-        "<html><head>",
-        "<meta charset='utf-8'>",
-        f"<title>Weekly SEO Update - {client_name}</title>",
-        f"<style>{get_css_styles()}</style>",
-        "</head><body>",
-        f"<h1>Weekly Update {client_name} SEO – Week {current_week}</h1>",
-        f"<p><em>Report generated: {current_date}</em></p>"
-    ]
+    # Inline style attributes per element (empty if premailer must run below)
+    styles = report_styles()
+    summary_style = styles.get('summary', '')
+    head_css = styles.get('head', '') if styles else get_css_styles()
 
-    # 30-Day vs Previous 30 Section
-    html_parts.append(f"<h2>{SECTION_HEADERS['30v30']}</h2>")
+    # Optional fragments carry their own trailing newline so absent ones leave no gap
+    def summary_box(summary_type: str) -> str:
+        summary = load_summary(client_slug, summary_type)
+        return f'<div class="summary-box"{summary_style}>{summary}</div>\n' if summary else ''
 
-    summary_30v30 = load_summary(client_slug, '30v30')
-    if summary_30v30:
-        html_parts.append(f"<div class='summary-box'>{summary_30v30}</div>")
+    def comparison_table(data_type: str) -> str:
+        data = load_comparison_data(client_slug, data_type)
+        return f'{df_to_html_table(data)}\n' if not data.empty else ''
 
-    data_30v30 = load_comparison_data(client_slug, '30v30')
-    if not data_30v30.empty:
-        html_parts.append(df_to_html_table(data_30v30))
+    data_ga4 = load_comparison_data(client_slug, 'ga4')
 
-    # Add 30v30 graph
-    graph_url_30v30 = get_graph_url(client_slug, '30v30')
-    html_parts.append(f"<img src='{graph_url_30v30}' class='seo-graph' alt='30-Day Comparison Chart' />")
+    raw_html = REPORT_TEMPLATE.format_map({
+        'client_name': client_name,
+        'current_week': current_week,
+        'current_date': current_date,
+        'headers': SECTION_HEADERS,
+        'head_style': f'<style>{head_css}</style>\n' if head_css else '',
+        'body_style': styles.get('body', ''),
+        'h1_style': styles.get('h1', ''),
+        'h2_style': styles.get('h2', ''),
+        'graph_style': styles.get('graph', ''),
+        'footer_style': styles.get('footer', ''),
+        'summary_30v30': summary_box('30v30'),
+        'table_30v30': comparison_table('30v30'),
+        'graph_url_30v30': get_graph_url(client_slug, '30v30', current_week),
+        'summary_yoy': summary_box('yoy'),
+        'table_yoy': comparison_table('yoy'),
+        'graph_url_yoy': get_graph_url(client_slug, 'yoy', current_week),
+        'ga4_section': (
+            df_to_html_table(data_ga4) if not data_ga4.empty
+            else "<p><em>Google Analytics data not available for this period.</em></p>"
+        ),
+    })
+
+    if styles:
+        return raw_html
 
-    # Year-over-Year Section
-    html_parts.append(f"<h2>{SECTION_HEADERS['yoy']}</h2>")
+    # Fallback: inline this report's CSS with premailer (unless it is too
+    # large for premailer to handle in reasonable time)
+    if len(raw_html) > INLINE_CSS_MAX_CHARS:
+        print(f"⚠️ Skipping CSS inlining: {len(raw_html):,} chars exceeds {INLINE_CSS_MAX_CHARS:,}")
+        return raw_html
 
-    summary_yoy = load_summary(client_slug, 'yoy')
-    if summary_yoy:
-        html_parts.append(f"<div class='summary-box'>{summary_yoy}</div>")
+    try:
+        return shared_premailer().transform(raw_html, pretty_print=False)
+    except Exception as e:
+        print(f"⚠️ CSS inlining failed: {e}")
+        return raw_html
 
-    data_yoy = load_comparison_data(client_slug, 'yoy')
-    if not data_yoy.empty:
-        html_parts.append(df_to_html_table(data_yoy))
 
-    # Add YoY graph
-    graph_url_yoy = get_graph_url(client_slug, 'yoy')
-    html_parts.append(f"<img src='{graph_url_yoy}' class='seo-graph' alt='Year-over-Year Chart' />")
+def report_digest(client_name: str, client_slug: str,
+                  current_week: int, current_date: str) -> str:
+    """
+    Hash everything a client's report is built from.
 
-    # Google Analytics Section
-    html_parts.append(f"<h2>{SECTION_HEADERS['ga4']}</h2>")
+    Covers the template and stylesheet, the rendered date and image host,
+    and the bytes of every data and summary file the report reads.
+    """
+    return input_digest(
+        REPORT_TEMPLATE, get_css_styles(), SECTION_HEADERS, IMAGE_HOST_URL,
+        client_name, current_week, current_date,
+        find_frame(f'GSC-30vs30-overMonth-{client_slug}'),
+        find_frame(f'GSC-YOY-overMonth-{client_slug}'),
+        DATA_DIR / f'GA4-organic-{client_slug}.csv.gz',
+        DATA_DIR / f'summary-30v30-{client_slug}.txt',
+        DATA_DIR / f'summary-yoy-{client_slug}.txt',
+    )
 
-    data_ga4 = load_comparison_data(client_slug, 'ga4')
-    if not data_ga4.empty:
-        html_parts.append(df_to_html_table(data_ga4))
-    else:
-        html_parts.append("<p><em>Google Analytics data not available for this period.</em></p>")
 
-    # Footer
-    html_parts.append("<div class='footer'>")
-    html_parts.append(f"<p>This report was automatically generated on {current_date}.</p>")
-    html_parts.append("<p>For questions about this report, please contact your SEO team.</p>")
-    html_parts.append("</div>")
+def save_report(data_file: Path, current_week: int, current_date: str) -> tuple:
+    """
+    Build and save one client's report (runs in a worker process).
 
-    html_parts.append("</body></html>")
+    The report is left as it is if it was already built from the same
+    inputs (see report_digest).
 
-    # Join and inline CSS for email compatibility
-    raw_html = '\n'.join(html_parts)
+    Returns:
+        (client_name, file name or None, error message or None, up_to_date)
+    """
+    client_slug = frame_slug(data_file, 'GSC-30vs30-overMonth-')
+    client_name = client_slug.replace('-', ' ').title()
 
     try:
-        return transform(raw_html)
-    except Exception as e:
-        print(f"⚠️ CSS inlining failed: {e}")
-        return raw_html
+        output_file = REPORTS_DIR / f'Weekly-Update-{client_name.replace(" ", "-")}-SEO-Week{current_week}.html'
+        digest = report_digest(client_name, client_slug, current_week, current_date)
+        if is_fresh(output_file, digest):
+            return client_name, output_file.name, None, True
 
+        html_content = build_report(client_name, client_slug, current_week, current_date)
 
-def load_client_config() -> pd.DataFrame:
-    """Load client configuration."""
-    config_path = Path(CLIENT_CONFIG_FILE)
-    if config_path.exists():
-        return pd.read_excel(config_path)
-    return pd.DataFrame()
+        # Encode once and hand the bytes straight to the OS (no text-mode
+        # encoder or write buffer in between)
+        with open(output_file, 'wb', buffering=0) as f:
+            f.write(html_content.encode('utf-8'))
+        mark_fresh(output_file, digest)
+
+        return client_name, output_file.name, None, False
+
+    except Exception as e:
+        return client_name, None, str(e), False
 
 
 def run():
     """
     Main execution function.
 
-    Builds HTML reports for all clients.
+    Builds HTML reports for all clients, one worker process per report.
     """
+    ensure_dirs()
+
+    # Data files are rewritten by every pipeline run; drop loads from earlier runs
+    load_summary.cache_clear()
+    load_comparison_data.cache_clear()
+    comparison_tables.cache_clear()
+
     print("=" * 60)
     print("📄 HTML Report Builder")
     print("=" * 60)
@@ -259,32 +508,38 @@ def run():
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Get client list from available data files
-    data_files = list(DATA_DIR.glob('GSC-30vs30-overMonth-*.csv'))
+    data_files = find_frames('GSC-30vs30-overMonth-')
     print(f"📁 Found data for {len(data_files)} clients")
 
     reports_generated = 0
-    current_week = datetime.today().isocalendar()[1]
-
-    for data_file in data_files:
-        client_slug = data_file.stem.replace('GSC-30vs30-overMonth-', '')
-        client_name = client_slug.replace('-', ' ').title()
-
-        print(f"\n📝 Building report: {client_name}")
 
-        try:
-            html_content = build_report(client_name, client_slug)
-
-            # Save report
-            output_file = REPORTS_DIR / f'Weekly-Update-{client_name.replace(" ", "-")}-SEO-Week{current_week}.html'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            print(f"   ✅ Saved: {output_file.name}")
+    # Read the clock once; every report in the run shows the same week and date
+    today = datetime.today()
+    current_week = today.isocalendar()[1]
+    current_date = today.strftime('%B %d, %Y')
+
+    # Inline the CSS and format every client's comparison tables before the
+    # workers fork, so they all inherit the results
+    report_styles()
+    for data_type in COMPARISON_PREFIXES:
+        comparison_tables(data_type)
+
+    with ProcessPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(data_files)))) as executor:
+        for client_name, output_name, error, up_to_date in executor.map(
+            save_report, data_files, repeat(current_week), repeat(current_date)
+        ):
+            print(f"\n📝 Building report: {client_name}")
+
+            if error:
+                print(f"   ❌ Error: {error}")
+                continue
+
+            if up_to_date:
+                print(f"   ⏭️ Up to date: {output_name}")
+            else:
+                print(f"   ✅ Saved: {output_name}")
             reports_generated += 1
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-
     print(f"\n✅ Report generation complete: {reports_generated} reports created")
 
     return {
@@ -6,20 +6,29 @@ Creates visual charts for SEO reports:
 - Year-over-year comparison charts
 - Trend line visualizations
 
-Uses Seaborn and Matplotlib for professional-quality graphics.
+Uses Seaborn and Matplotlib for professional-quality graphics. Charts are
+rendered in parallel worker processes on the non-interactive Agg backend.
+
+Run on its own from the project root with
+`python -m src.report_generation.generate_graphs`.
 """
 
 import os
+import sys
+import multiprocessing
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from config.settings import DATA_DIR, GRAPHS_DIR
+from config.settings import GRAPHS_DIR, ensure_dirs
+from src.data_processing.storage import find_frames, frame_slug, read_frame
+from src.report_generation._output_cache import input_digest, is_fresh, mark_fresh
 
 # Configure Seaborn styling
 sns.set_theme(style="whitegrid")
@@ -32,22 +41,51 @@ COLORS = {
     'warning': '#DC3545',    # Negative change (red)
 }
 
+# Chart resolution; 12x5 in at 100 dpi is wider than email clients display
+CHART_DPI = 100
+
+# Pillow PNG encoder options (smallest file, lossless)
+PNG_OPTIONS = {'optimize': True, 'compress_level': 9}
+
+# Worker processes rendering charts in parallel
+MAX_WORKERS = os.cpu_count() or 1
+
+# Start method for the chart workers: fork on Linux (whatever the Python
+# default), so workers inherit the imported matplotlib/seaborn and the
+# loaded font manager instead of importing and loading them again
+MP_CONTEXT = multiprocessing.get_context('fork' if sys.platform.startswith('linux') else None)
+
+# Chart kinds: (data file prefix, graph file prefix, title, format_type)
+CHART_TYPES = [
+    ('GSC-30vs30-overMonth-', 'GSC-30vs30', "30 Days vs Previous 30 Days", "30vs30"),
+    ('GSC-YOY-overMonth-', 'GSC-YOY', "Year-over-Year Comparison (30 Days)", "YOY"),
+]
+
+
+@lru_cache(maxsize=1)
+def chart_figure() -> tuple:
+    """
+    Return this process's (figure, axes) pair for comparison charts.
+
+    The figure is created once per worker and cleared between charts
+    instead of being built and torn down for every chart.
+    """
+    fig, axs = plt.subplots(nrows=1, ncols=2, figsize=(12, 5))
+    return fig, axs.flatten()
+
 
 def generate_comparison_chart(csv_path: Path, output_path: Path,
                               title: str, format_type: str = "30vs30"):
     """
-    Generate a comparison bar chart from CSV data.
+    Generate a comparison bar chart from a comparison data file.
 
     Args:
-        csv_path: Path to CSV with comparison data
+        csv_path: Path to the comparison data (Parquet or CSV)
         output_path: Path to save the PNG output
         title: Chart title
         format_type: '30vs30' or 'YOY' for column name mapping
     """
     try:
-        df = pd.read_csv(csv_path)
-        df.columns = [col.strip() for col in df.columns]
-
         # Map columns based on format type
         if format_type == "30vs30":
             metric_col = "Metric"
@@ -62,6 +100,14 @@ def generate_comparison_chart(csv_path: Path, output_path: Path,
             label_current = "This Year"
             label_previous = "Last Year"
 
+        # Read only the three columns the chart needs
+        df = read_frame(
+            csv_path,
+            columns=[metric_col, current_col, previous_col],
+            dtype={metric_col: 'string'}
+        )
+        df.columns = [col.strip() for col in df.columns]
+
         # Validate columns exist
         required_cols = [metric_col, current_col, previous_col]
         for col in required_cols:
@@ -72,31 +118,36 @@ def generate_comparison_chart(csv_path: Path, output_path: Path,
         # Focus on Clicks and Impressions for clarity
         metrics = ["Clicks", "Impressions"]
 
-        fig, axs = plt.subplots(nrows=1, ncols=2, figsize=(12, 5))
-        axs = axs.flatten()
+        # Clean both value columns in one vectorized pass (CSV copies may
+        # hold text such as '1,234' or '4.00%'), then index rows by metric
+        for col in (current_col, previous_col):
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(
+                    df[col].astype(str).str.replace('[%,]', '', regex=True),
+                    errors='coerce'
+                )
+        values = df.set_index(df[metric_col].astype(str).str.strip().str.lower())
+        values = values[~values.index.duplicated()]
+
+        fig, axs = chart_figure()
+        for ax in axs:
+            ax.clear()
+
+        # tight_layout starts from the current subplot positions; restore the
+        # defaults so the layout matches a freshly created figure
+        fig.subplots_adjust(**{
+            param: plt.rcParams[f'figure.subplot.{param}']
+            for param in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
 
         for i, metric in enumerate(metrics):
-            sub_df = df[df[metric_col].str.strip().str.lower() == metric.lower()]
-
-            if sub_df.empty:
+            if metric.lower() not in values.index:
                 axs[i].text(0.5, 0.5, f"No {metric} data",
                            ha='center', va='center', transform=axs[i].transAxes)
                 continue
 
-            row = sub_df.iloc[0]
-
-            # Handle numeric conversion
-            current_val = row[current_col]
-            previous_val = row[previous_col]
-
-            # Remove % signs if present
-            if isinstance(current_val, str):
-                current_val = float(current_val.replace('%', '').replace(',', ''))
-            if isinstance(previous_val, str):
-                previous_val = float(previous_val.replace('%', '').replace(',', ''))
-
-            current_val = float(current_val)
-            previous_val = float(previous_val)
+            current_val = float(values.at[metric.lower(), current_col])
+            previous_val = float(values.at[metric.lower(), previous_col])
 
             # Create plot data
             plot_df = pd.DataFrame({
@@ -132,12 +183,11 @@ def generate_comparison_chart(csv_path: Path, output_path: Path,
 
         # Add overall title
         fig.suptitle(title, fontsize=14, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save figure
-        plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        plt.close()
+        fig.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight',
+                    facecolor='white', edgecolor='none', pil_kwargs=PNG_OPTIONS)
 
         print(f"   ✅ Saved: {output_path.name}")
         return True
@@ -147,12 +197,36 @@ def generate_comparison_chart(csv_path: Path, output_path: Path,
         return False
 
 
+def render_chart(task: tuple) -> bool:
+    """
+    Worker entry point: generate_comparison_chart for one task tuple.
+
+    The chart is skipped if it was already rendered from the same data,
+    title, format, colours, output settings and plotting library versions.
+    """
+    csv_path, output_path, title, format_type = task
+    digest = input_digest(
+        csv_path, title, format_type, COLORS, CHART_DPI, PNG_OPTIONS,
+        matplotlib.__version__, sns.__version__
+    )
+    if is_fresh(output_path, digest):
+        print(f"   ⏭️ Up to date: {output_path.name}")
+        return True
+
+    if not generate_comparison_chart(*task):
+        return False
+    mark_fresh(output_path, digest)
+    return True
+
+
 def run():
     """
     Main execution function.
 
     Generates graphs for all comparison data files.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("📊 Graph Generator")
     print("=" * 60)
@@ -161,35 +235,21 @@ def run():
     GRAPHS_DIR.mkdir(parents=True, exist_ok=True)
 
     current_week = datetime.today().isocalendar()[1]
-    graphs_generated = 0
-
-    # Generate 30vs30 graphs
-    print("\n📈 Generating 30-Day Comparison Graphs...")
-    for csv_file in DATA_DIR.glob('GSC-30vs30-overMonth-*.csv'):
-        client_slug = csv_file.stem.replace('GSC-30vs30-overMonth-', '')
-        output_file = GRAPHS_DIR / f'GSC-30vs30-week{current_week}-{client_slug}.png'
-
-        print(f"\n   Processing: {client_slug}")
-        if generate_comparison_chart(
-            csv_file, output_file,
-            title="30 Days vs Previous 30 Days",
-            format_type="30vs30"
-        ):
-            graphs_generated += 1
-
-    # Generate YoY graphs
-    print("\n📅 Generating Year-over-Year Graphs...")
-    for csv_file in DATA_DIR.glob('GSC-YOY-overMonth-*.csv'):
-        client_slug = csv_file.stem.replace('GSC-YOY-overMonth-', '')
-        output_file = GRAPHS_DIR / f'GSC-YOY-week{current_week}-{client_slug}.png'
-
-        print(f"\n   Processing: {client_slug}")
-        if generate_comparison_chart(
-            csv_file, output_file,
-            title="Year-over-Year Comparison (30 Days)",
-            format_type="YOY"
-        ):
-            graphs_generated += 1
+
+    # One (data file, output file, title, format_type) task per chart
+    tasks = []
+    for data_prefix, graph_prefix, title, format_type in CHART_TYPES:
+        for csv_file in find_frames(data_prefix):
+            client_slug = frame_slug(csv_file, data_prefix)
+            output_file = GRAPHS_DIR / f'{graph_prefix}-week{current_week}-{client_slug}.png'
+            tasks.append((csv_file, output_file, title, format_type))
+
+    print(f"\n📈 Rendering {len(tasks)} comparison graphs...")
+
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(tasks))), mp_context=MP_CONTEXT
+    ) as executor:
+        graphs_generated = sum(executor.map(render_chart, tasks))
 
     print(f"\n✅ Graph generation complete: {graphs_generated} graphs created")
 
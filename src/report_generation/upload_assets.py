@@ -3,25 +3,165 @@ Asset Uploader
 
 Uploads generated graph images to hosting server via SFTP.
 Images are then referenced in HTML reports via public URLs.
+
+Graphs whose remote copy already matches (same size, and the same
+content hash as the last upload, or the same mtime for files never
+uploaded from here) are not re-sent.
+
+The SSH connection is kept open for the life of the process, so repeated
+uploads from one orchestrator run pay the handshake once.
+
+Run on its own from the project root with
+`python -m src.report_generation.upload_assets`.
 """
 
 import os
+import atexit
+import json
+import queue
+import hashlib
 import paramiko
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from config.settings import (
     SFTP_HOST, SFTP_PORT, SFTP_USER, SFTP_PASS,
-    SFTP_REMOTE_FOLDER, GRAPHS_DIR
+    SFTP_REMOTE_FOLDER, GRAPHS_DIR, DATA_DIR, ensure_dirs
 )
+from src.file_scan import list_files
+
+# SFTP channels opened on the one SSH connection to upload files concurrently
+SFTP_CHANNELS = 4
+
+# Seconds between SSH keepalive packets on the idle shared connection
+SFTP_KEEPALIVE = 30
+
+# SHA-256 of each file last uploaded, keyed "host:remote path". Kept in a
+# subdirectory so cleanup (which only moves top-level files) keeps it
+UPLOAD_MANIFEST = DATA_DIR / '.upload_cache' / 'manifest.json'
+
+
+# SSH transport shared by every upload in this process (opened on first use)
+_TRANSPORT = None
+
+
+def get_transport() -> paramiko.Transport:
+    """Return the shared SSH transport, (re)connecting if it is not active."""
+    global _TRANSPORT
+    if _TRANSPORT is None or not _TRANSPORT.is_active():
+        close_transport()
+        transport = paramiko.Transport((SFTP_HOST, SFTP_PORT))
+        try:
+            transport.connect(username=SFTP_USER, password=SFTP_PASS)
+        except Exception:
+            transport.close()
+            raise
+        transport.set_keepalive(SFTP_KEEPALIVE)
+        _TRANSPORT = transport
+        print(f"📡 Connected to {SFTP_HOST}")
+    return _TRANSPORT
 
 
-def upload_files_sftp():
+def close_transport():
+    """Close the shared SSH transport, if one is open."""
+    global _TRANSPORT
+    if _TRANSPORT is not None:
+        _TRANSPORT.close()
+        _TRANSPORT = None
+        print("🔒 Connection closed")
+
+
+atexit.register(close_transport)
+
+
+def load_manifest() -> dict:
+    """Return the upload manifest ({} if there is none yet)."""
+    try:
+        return json.loads(UPLOAD_MANIFEST.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict):
+    """Write the upload manifest (atomic replace)."""
+    UPLOAD_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = UPLOAD_MANIFEST.with_name(f'{UPLOAD_MANIFEST.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, UPLOAD_MANIFEST)
+
+
+def file_sha256(file_path: Path) -> str:
+    """Return the hex SHA-256 of a file, read in 64 KiB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remote_is_current(sftp, remote_path: str, local_stat, digest: str, uploaded_digest) -> bool:
+    """
+    Return True if the remote copy can be kept.
+
+    It must exist with the local file's size and hold the content recorded
+    in the manifest; files the manifest has no entry for (e.g. uploaded
+    from another machine) fall back to matching the local file's mtime.
+    """
+    try:
+        remote_stat = sftp.stat(remote_path)
+    except IOError:
+        return False
+
+    if remote_stat.st_size != local_stat.st_size:
+        return False
+    if uploaded_digest is not None:
+        return digest == uploaded_digest
+    return remote_stat.st_mtime == int(local_stat.st_mtime)
+
+
+def upload_file(channels: queue.Queue, file_path: Path, manifest: dict) -> tuple:
+    """
+    Upload one file over whichever SFTP channel is free, unless the
+    remote copy is already current. Updates manifest on success.
+
+    Returns:
+        (file_path, 'uploaded' or 'skipped', exception or None)
+    """
+    remote_path = f"{SFTP_REMOTE_FOLDER}/{file_path.name}"
+    key = f"{SFTP_HOST}:{remote_path}"
+
+    sftp = channels.get()
+    try:
+        local_stat = file_path.stat()
+        digest = file_sha256(file_path)
+
+        if remote_is_current(sftp, remote_path, local_stat, digest, manifest.get(key)):
+            manifest[key] = digest
+            return file_path, 'skipped', None
+
+        sftp.put(str(file_path), remote_path)
+        # Carry the local mtime over so the next size/mtime check can match
+        sftp.utime(remote_path, (local_stat.st_atime, local_stat.st_mtime))
+        manifest[key] = digest
+        return file_path, 'uploaded', None
+    except Exception as e:
+        return file_path, 'failed', e
+    finally:
+        channels.put(sftp)
+
+
+def upload_files_sftp(files: list = None):
     """
     Upload graph files to SFTP server.
 
+    Up to SFTP_CHANNELS SFTP sessions are multiplexed over the shared SSH
+    transport, so the handshake is paid once while several files are in
+    flight (each put already pipelines its writes). The sessions are
+    closed afterwards; the transport stays open for the next call.
+
+    Args:
+        files: Files to upload (default: every PNG in GRAPHS_DIR)
+
     Returns:
         dict with upload results
     """
@@ -31,13 +171,16 @@ def upload_files_sftp():
             'message': 'SFTP credentials not configured'
         }
 
+    if files is None:
+        files = list_files(GRAPHS_DIR, suffix='.png')
+
+    sessions = []
+
     try:
-        # Initialize SSH transport
-        transport = paramiko.Transport((SFTP_HOST, SFTP_PORT))
-        transport.connect(username=SFTP_USER, password=SFTP_PASS)
+        # Reuse (or open) the shared SSH transport
+        transport = get_transport()
         sftp = paramiko.SFTPClient.from_transport(transport)
-
-        print(f"📡 Connected to {SFTP_HOST}")
+        sessions.append(sftp)
 
         # Change to remote directory
         try:
@@ -45,48 +188,62 @@ def upload_files_sftp():
             print(f"📁 Remote folder: {SFTP_REMOTE_FOLDER}")
         except IOError:
             print(f"⚠️ Remote folder '{SFTP_REMOTE_FOLDER}' not accessible")
-            sftp.close()
-            transport.close()
             return {
                 'success': False,
                 'message': f'Remote folder not accessible: {SFTP_REMOTE_FOLDER}'
             }
 
+        # Open the remaining channels and hand them out through a queue
+        while len(sessions) < min(SFTP_CHANNELS, len(files)):
+            sessions.append(paramiko.SFTPClient.from_transport(transport))
+
+        channels = queue.Queue()
+        for session in sessions:
+            channels.put(session)
+
         # Upload files
         uploaded = 0
+        skipped = 0
         failed = 0
+        manifest = load_manifest()
 
-        for file_path in GRAPHS_DIR.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() == '.png':
-                remote_path = f"{SFTP_REMOTE_FOLDER}/{file_path.name}"
-
-                try:
-                    print(f"   ⬆️ Uploading: {file_path.name}")
-                    sftp.put(str(file_path), remote_path)
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            results = executor.map(lambda file_path: upload_file(channels, file_path, manifest), files)
+            for file_path, status, error in results:
+                if status == 'uploaded':
+                    print(f"   ⬆️ Uploaded: {file_path.name}")
                     uploaded += 1
-                except Exception as e:
-                    print(f"   ❌ Failed: {file_path.name} - {e}")
+                elif status == 'skipped':
+                    print(f"   ⏭️ Unchanged: {file_path.name}")
+                    skipped += 1
+                else:
+                    print(f"   ❌ Failed: {file_path.name} - {error}")
                     failed += 1
 
-        # Close connections
-        sftp.close()
-        transport.close()
-        print("🔒 Connection closed")
+        save_manifest(manifest)
 
         return {
             'success': failed == 0,
-            'message': f'Uploaded {uploaded} files, {failed} failed',
+            'message': f'Uploaded {uploaded} files, {skipped} unchanged, {failed} failed',
             'uploaded': uploaded,
+            'skipped': skipped,
             'failed': failed
         }
 
     except Exception as e:
         print(f"❌ SFTP Error: {e}")
+        # Don't hand a possibly broken connection to the next call
+        close_transport()
         return {
             'success': False,
             'message': str(e)
         }
 
+    finally:
+        # Close the SFTP channels (the transport is kept for reuse)
+        for session in sessions:
+            session.close()
+
 
 def run():
     """
@@ -94,6 +251,8 @@ def run():
 
     Uploads all graph images to the hosting server.
     """
+    ensure_dirs()
+
     print("=" * 60)
     print("⬆️ Asset Uploader (SFTP)")
     print("=" * 60)
@@ -105,7 +264,7 @@ def run():
         }
 
     # Count files to upload
-    png_files = list(GRAPHS_DIR.glob('*.png'))
+    png_files = list_files(GRAPHS_DIR, suffix='.png')
     print(f"📁 Found {len(png_files)} graph files to upload")
 
     if not png_files:
@@ -116,7 +275,7 @@ def run():
         }
 
     # Perform upload
-    result = upload_files_sftp()
+    result = upload_files_sftp(png_files)
 
     if result['success']:
         print(f"\n✅ Upload complete: {result.get('uploaded', 0)} files")